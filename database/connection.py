@@ -7,6 +7,17 @@ from typing import Optional, Union
 import sqlite3
 import os
 
+# Applied to the connection the main window keeps open for its lifetime
+SHARED_CONNECTION_PRAGMAS = (
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-20000",
+)
+
+# Prepared statements kept per shared connection; sqlite3 defaults to 128
+SHARED_CACHED_STATEMENTS = 256
+
 class DatabaseManager:
     """Manages SQLite database connections."""
     
@@ -16,15 +27,34 @@ class DatabaseManager:
         # Ensure the data directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
     
-    def connect(self) -> sqlite3.Connection:
-        """Create and return a database connection."""
-        conn = sqlite3.connect(self.db_path)
+    def connect(self, cached_statements: int = 128) -> sqlite3.Connection:
+        """Create and return a database connection.
+        
+        Args:
+            cached_statements: Number of prepared statements sqlite3 keeps,
+                keyed by SQL text, for reuse on this connection.
+        """
+        conn = sqlite3.connect(self.db_path, cached_statements=cached_statements)
         # Enable foreign keys
         conn.execute("PRAGMA foreign_keys = ON")
         # Use WAL mode for better concurrency
         conn.execute("PRAGMA journal_mode=WAL")
         return conn
     
+    def connect_shared(self) -> sqlite3.Connection:
+        """Create a long-lived connection tuned for frequent small writes.
+        
+        WAL with synchronous=NORMAL only syncs at checkpoints, and implicit
+        transactions start IMMEDIATE so a write never has to upgrade a read lock.
+        The model queries use constant SQL text, so a larger statement cache
+        lets every hot query skip re-preparation.
+        """
+        conn = self.connect(cached_statements=SHARED_CACHED_STATEMENTS)
+        conn.isolation_level = "IMMEDIATE"
+        for pragma in SHARED_CONNECTION_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+        return conn
+    
     def __enter__(self) -> sqlite3.Connection:
         """Context manager entry."""
         return self.connect()
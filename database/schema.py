@@ -90,16 +90,19 @@ CREATE TABLE IF NOT EXISTS encyclopedia_entries (
 );
 """
 
+# Whole schema as one script, in dependency order
+SCHEMA_SQL = "".join((
+    PROJECTS_TABLE_SQL,
+    STORIES_TABLE_SQL,
+    CHAPTERS_TABLE_SQL,
+    CHARACTERS_TABLE_SQL,
+    CHAPTER_CHARACTERS_TABLE_SQL,
+    ENCYCLOPEDIA_ENTRIES_TABLE_SQL,
+))
+
 def create_all_tables(connection: sqlite3.Connection) -> None:
     """Create all tables if they don't exist."""
-    cursor = connection.cursor()
-    cursor.execute(PROJECTS_TABLE_SQL)
-    cursor.execute(STORIES_TABLE_SQL)
-    cursor.execute(CHAPTERS_TABLE_SQL)
-    cursor.execute(CHARACTERS_TABLE_SQL)
-    cursor.execute(CHAPTER_CHARACTERS_TABLE_SQL)
-    cursor.execute(ENCYCLOPEDIA_ENTRIES_TABLE_SQL)
-    connection.commit()
+    connection.executescript(SCHEMA_SQL)
     
     # Run migrations for existing databases
     migrate_database(connection)
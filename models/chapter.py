@@ -4,7 +4,7 @@ Represents a sticky note on the timeline canvas.
 """
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple, Iterator
 import sqlite3
 
 @dataclass
@@ -23,12 +23,13 @@ class Chapter:
     updated_at: Optional[datetime] = None
     
     @classmethod
-    def create(cls, conn: sqlite3.Connection, story_id: int, title: str, summary: str = "", content: str = "") -> "Chapter":
+    def create(cls, conn: sqlite3.Connection, story_id: int, title: str, summary: str = "", content: str = "",
+               board_x: float = 100.0, board_y: float = 100.0) -> "Chapter":
         """Insert new chapter and return instance."""
         cursor = conn.cursor()
         cursor.execute(
-            "INSERT INTO chapters (story_id, title, summary, content) VALUES (?, ?, ?, ?)",
-            (story_id, title, summary, content)
+            "INSERT INTO chapters (story_id, title, summary, content, board_x, board_y) VALUES (?, ?, ?, ?, ?, ?)",
+            (story_id, title, summary, content, board_x, board_y)
         )
         conn.commit()
         
@@ -75,6 +76,32 @@ class Chapter:
             updated_at=datetime.fromisoformat(row[10]) if row[10] else None
         )
     
+    @classmethod
+    def count_by_story(cls, conn: sqlite3.Connection, story_id: int) -> int:
+        """Return the number of chapters in a story."""
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM chapters WHERE story_id = ?", (story_id,))
+        return cursor.fetchone()[0]
+    
+    @classmethod
+    def get_summaries_by_story(cls, conn: sqlite3.Connection, story_id: int) -> List["Chapter"]:
+        """Retrieve a story's chapters with only the fields a sticky note shows.
+        
+        Content and timestamps are left at their defaults; use get_by_id for
+        the full chapter.
+        """
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT id, title, summary, board_x, board_y, sort_order, color FROM chapters "
+            "WHERE story_id = ? ORDER BY sort_order, created_at DESC",
+            (story_id,)
+        )
+        return [
+            cls(id=row[0], story_id=story_id, title=row[1], summary=row[2],
+                board_x=row[3], board_y=row[4], sort_order=row[5], color=row[6])
+            for row in cursor.fetchall()
+        ]
+    
     @classmethod
     def get_by_story(cls, conn: sqlite3.Connection, story_id: int) -> List["Chapter"]:
         """Retrieve all chapters for a story."""
@@ -100,6 +127,33 @@ class Chapter:
         
         return chapters
     
+    @classmethod
+    def iter_by_board_position(cls, conn: sqlite3.Connection, story_id: int) -> Iterator["Chapter"]:
+        """Yield a story's chapters in reading order (top to bottom, left to right).
+        
+        Rows are fetched one at a time, so only the current chapter's content
+        is held in memory.
+        """
+        cursor = conn.execute(
+            "SELECT * FROM chapters WHERE story_id = ? "
+            "ORDER BY board_y, board_x, sort_order, created_at DESC",
+            (story_id,)
+        )
+        for row in cursor:
+            yield cls(
+                id=row[0],
+                story_id=row[1],
+                title=row[2],
+                summary=row[3],
+                content=row[4],
+                board_x=row[5],
+                board_y=row[6],
+                sort_order=row[7],
+                color=row[8],
+                created_at=datetime.fromisoformat(row[9]) if row[9] else None,
+                updated_at=datetime.fromisoformat(row[10]) if row[10] else None
+            )
+    
     @classmethod
     def get_all(cls, conn: sqlite3.Connection) -> List["Chapter"]:
         """Retrieve all chapters."""
@@ -134,6 +188,21 @@ class Chapter:
         )
         conn.commit()
     
+    @classmethod
+    def update_positions(cls, conn: sqlite3.Connection, positions: Dict[int, Tuple[float, float]]) -> None:
+        """Update board positions for several chapters in one transaction.
+        
+        Args:
+            conn: Database connection
+            positions: Mapping of chapter ID to (board_x, board_y)
+        """
+        cursor = conn.cursor()
+        cursor.executemany(
+            "UPDATE chapters SET board_x = ?, board_y = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            [(x, y, chapter_id) for chapter_id, (x, y) in positions.items()]
+        )
+        conn.commit()
+    
     def delete(self, conn: sqlite3.Connection) -> None:
         """Delete chapter from database."""
         cursor = conn.cursor()
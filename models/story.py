@@ -100,6 +100,24 @@ class Story:
         rows = cursor.fetchall()
         return [cls._from_row(row) for row in rows]
     
+    @classmethod
+    def get_summaries_by_project(cls, conn: sqlite3.Connection, project_id: int) -> List["Story"]:
+        """Retrieve a project's stories, in order, with only the fields a story tab shows.
+        
+        Timestamps are left unset; use get_by_id for the full story.
+        """
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT id, title, synopsis, sort_order, status FROM stories "
+            "WHERE project_id = ? ORDER BY sort_order ASC, created_at ASC",
+            (project_id,)
+        )
+        return [
+            cls(id=row[0], project_id=project_id, title=row[1], synopsis=row[2],
+                sort_order=row[3], status=row[4] if row[4] else STATUS_DRAFT)
+            for row in cursor.fetchall()
+        ]
+    
     @classmethod
     def get_all(cls, conn: sqlite3.Connection) -> List["Story"]:
         """Retrieve all stories."""
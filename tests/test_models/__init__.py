@@ -0,0 +1,2 @@
+"""Model-specific test configuration."""
+import pytest
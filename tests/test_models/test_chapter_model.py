@@ -0,0 +1,78 @@
+"""
+Unit tests for the Chapter model's batch helpers.
+
+Tests the lightweight queries and writes used by the timeline canvas.
+"""
+from models.chapter import Chapter
+
+
+class TestChapterModel:
+    """Test cases for Chapter model classmethods."""
+    
+    def test_update_positions(self, test_db_connection, sample_story):
+        """Test that several chapter positions are written in one call."""
+        first = Chapter.create(test_db_connection, sample_story.id, "First")
+        second = Chapter.create(test_db_connection, sample_story.id, "Second")
+        
+        Chapter.update_positions(test_db_connection, {
+            first.id: (10.0, 20.0),
+            second.id: (30.5, 40.5),
+        })
+        
+        first = Chapter.get_by_id(test_db_connection, first.id)
+        second = Chapter.get_by_id(test_db_connection, second.id)
+        assert (first.board_x, first.board_y) == (10.0, 20.0)
+        assert (second.board_x, second.board_y) == (30.5, 40.5)
+    
+    def test_update_positions_empty(self, test_db_connection):
+        """Test that an empty batch is a no-op."""
+        Chapter.update_positions(test_db_connection, {})
+    
+    def test_create_with_position(self, test_db_connection, sample_story):
+        """Test that a chapter can be inserted at a given board position."""
+        chapter = Chapter.create(test_db_connection, sample_story.id, "Placed",
+                                 board_x=250.0, board_y=75.0)
+        
+        assert (chapter.board_x, chapter.board_y) == (250.0, 75.0)
+        stored = Chapter.get_by_id(test_db_connection, chapter.id)
+        assert (stored.board_x, stored.board_y) == (250.0, 75.0)
+    
+    def test_count_by_story(self, test_db_connection, sample_story):
+        """Test that chapters are counted without loading them."""
+        assert Chapter.count_by_story(test_db_connection, sample_story.id) == 0
+        
+        Chapter.create(test_db_connection, sample_story.id, "First")
+        Chapter.create(test_db_connection, sample_story.id, "Second")
+        
+        assert Chapter.count_by_story(test_db_connection, sample_story.id) == 2
+    
+    def test_get_summaries_by_story(self, test_db_connection, sample_story):
+        """Test that summaries carry the sticky-note fields but not content."""
+        chapter = Chapter.create(test_db_connection, sample_story.id, "First",
+                                 summary="Short", content="Long body",
+                                 board_x=12.0, board_y=34.0)
+        
+        summaries = Chapter.get_summaries_by_story(test_db_connection, sample_story.id)
+        
+        assert len(summaries) == 1
+        summary = summaries[0]
+        assert summary.id == chapter.id
+        assert summary.story_id == sample_story.id
+        assert (summary.title, summary.summary) == ("First", "Short")
+        assert (summary.board_x, summary.board_y) == (12.0, 34.0)
+        assert summary.color == chapter.color
+        assert summary.content == ""
+    
+    def test_iter_by_board_position(self, test_db_connection, sample_story):
+        """Test that chapters are yielded top to bottom, then left to right."""
+        lower = Chapter.create(test_db_connection, sample_story.id, "Lower",
+                               content="Body", board_x=0.0, board_y=200.0)
+        right = Chapter.create(test_db_connection, sample_story.id, "Right",
+                               board_x=300.0, board_y=100.0)
+        left = Chapter.create(test_db_connection, sample_story.id, "Left",
+                              board_x=100.0, board_y=100.0)
+        
+        chapters = list(Chapter.iter_by_board_position(test_db_connection, sample_story.id))
+        
+        assert [c.id for c in chapters] == [left.id, right.id, lower.id]
+        assert chapters[2].content == "Body"
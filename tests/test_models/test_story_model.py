@@ -0,0 +1,29 @@
+"""
+Unit tests for the Story model's lightweight queries.
+
+Tests the reduced-column reads used by the story manager sidebar.
+"""
+from models.story import Story, STATUS_FINAL_PUBLISHED
+
+
+class TestStoryModel:
+    """Test cases for Story model classmethods."""
+    
+    def test_get_summaries_by_project(self, test_db_connection, sample_project):
+        """Test that summaries keep order and the fields a tab needs."""
+        first = Story.create(test_db_connection, sample_project.id, "First", "Opening")
+        second = Story.create(test_db_connection, sample_project.id, "Second")
+        second.publish_final(test_db_connection)
+        
+        summaries = Story.get_summaries_by_project(test_db_connection, sample_project.id)
+        
+        assert [s.id for s in summaries] == [first.id, second.id]
+        assert (summaries[0].title, summaries[0].synopsis) == ("First", "Opening")
+        assert summaries[0].project_id == sample_project.id
+        assert summaries[1].status == STATUS_FINAL_PUBLISHED
+        assert summaries[1].is_locked
+        assert summaries[0].created_at is None
+    
+    def test_get_summaries_by_project_empty(self, test_db_connection, sample_project):
+        """Test that a project without stories returns an empty list."""
+        assert Story.get_summaries_by_project(test_db_connection, sample_project.id) == []
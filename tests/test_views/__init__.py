@@ -0,0 +1,2 @@
+"""View-specific test configuration."""
+import pytest
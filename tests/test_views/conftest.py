@@ -0,0 +1,18 @@
+"""
+Fixtures for view tests.
+
+Widgets run on Qt's offscreen platform so no display is needed.
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Provide the QApplication required by widgets."""
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,51 @@
+"""
+Unit tests for the sticky note's cached rendering.
+"""
+import pytest
+
+from models.chapter import Chapter
+from views.sticky_note import StickyNote
+
+
+@pytest.fixture
+def chapter():
+    """Provide an unsaved chapter to display."""
+    return Chapter(id=1, story_id=1, title="Opening", summary="It begins", color="#FFFF88")
+
+
+@pytest.fixture
+def note(qapp, chapter):
+    """Provide a sticky note showing the chapter."""
+    return StickyNote(chapter)
+
+
+class TestStickyNoteRendering:
+    """Test cases for repainting after chapter edits."""
+    
+    def test_in_place_title_edit_repaints(self, note, chapter):
+        """Test that editing the shared chapter object changes the rendering."""
+        before = note.grab().toImage()
+        
+        chapter.title = "Rewritten"
+        chapter.summary = "It ends"
+        note.update_from_chapter(chapter)
+        
+        assert note.grab().toImage() != before
+        assert note._display_title == "Rewritten"
+    
+    def test_in_place_color_change_repaints(self, note, chapter):
+        """Test that a color set on the chapter shows without update_from_chapter."""
+        before = note.grab().toImage()
+        
+        chapter.color = "#88CCFF"
+        note.update()
+        
+        assert note.grab().toImage() != before
+    
+    def test_unchanged_chapter_reuses_rendering(self, note):
+        """Test that repainting an unchanged note keeps the cached pixmap."""
+        note.grab()
+        cached = note._cached_pixmap
+        
+        note.grab()
+        assert note._cached_pixmap is cached
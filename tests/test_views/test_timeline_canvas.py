@@ -0,0 +1,57 @@
+"""
+Unit tests for the timeline canvas background cache.
+"""
+import pytest
+
+from views.timeline_canvas import TimelineCanvas
+
+
+@pytest.fixture
+def canvas(qapp):
+    """Provide a full-screen sized canvas reporting a HiDPI pixel ratio."""
+    canvas = TimelineCanvas()
+    canvas.resize(1920, 1080)
+    canvas.devicePixelRatioF = lambda: 2.0
+    return canvas
+
+
+class TestTimelineCanvasBackground:
+    """Test cases for the cached background rendering."""
+    
+    def test_background_cached_at_hidpi_ratio(self, canvas):
+        """Test that the background is cached at 100% zoom on a ratio 2 screen."""
+        cached = canvas._background_pixmap()
+        
+        assert cached is not None
+        _, pixmap = cached
+        assert pixmap.devicePixelRatio() == 2.0
+        extent = TimelineCanvas._BACKGROUND_EXTENT
+        assert pixmap.width() >= extent.width() * 2
+        assert pixmap.height() >= extent.height() * 2
+    
+    def test_background_reused_while_panning(self, canvas):
+        """Test that a whole-pixel pan reuses the cached rendering."""
+        _, pixmap = canvas._background_pixmap()
+        canvas.pan_x += 10
+        
+        position, panned = canvas._background_pixmap()
+        assert panned is pixmap
+        assert position.x() == pytest.approx(10 + TimelineCanvas._BACKGROUND_EXTENT.left())
+    
+    def test_background_not_cached_when_too_large(self, canvas):
+        """Test that zoom levels past the size limit paint directly."""
+        canvas.zoom_level = 5.0
+        
+        assert canvas._background_pixmap() is None
+    
+    def test_background_not_rebuilt_during_zoom_burst(self, canvas):
+        """Test that zoom steps paint directly until the zoom settles."""
+        _, pixmap = canvas._background_pixmap()
+        
+        canvas.zoom_in()
+        assert canvas._background_pixmap() is None
+        assert canvas._background_cache is pixmap
+        
+        canvas._zoom_settle_timer.stop()
+        _, settled = canvas._background_pixmap()
+        assert settled is not pixmap
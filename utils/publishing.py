@@ -4,8 +4,9 @@ Handles PDF, DOCX, and EPUB generation for rough and final drafts.
 """
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 from html.parser import HTMLParser
 
 from reportlab.lib.pagesizes import letter
@@ -76,6 +77,27 @@ def html_to_paragraphs(html: str) -> List[str]:
     return [p.strip() for p in paragraphs if p.strip()]
 
 
+class _StreamedFlowables(list):
+    """Flowable list for ``doc.build`` that is filled one chunk at a time.
+    
+    Platypus consumes flowables from the front of the list and checks its
+    length after each one; the next chunk is pulled only when the list runs
+    dry, so at most one chunk (a chapter) is held in memory.
+    """
+    
+    def __init__(self, chunks: Iterable[List]):
+        super().__init__()
+        self._chunks = iter(chunks)
+    
+    def __len__(self) -> int:
+        while not super().__len__():
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self.extend(chunk)
+        return super().__len__()
+
+
 class StoryPublisher:
     """Handles publishing stories to various formats."""
     
@@ -156,25 +178,29 @@ class StoryPublisher:
             if not story:
                 raise ValueError(f"Story with ID {story_id} not found")
             
-            chapters = Chapter.get_by_story(conn, story_id)
-        
-        # Sort chapters by board position (left to right, top to bottom)
-        chapters.sort(key=lambda c: (c.board_y, c.board_x))
-        
-        # Create the PDF document
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=letter,
-            rightMargin=1*inch,
-            leftMargin=1*inch,
-            topMargin=1*inch,
-            bottomMargin=1*inch
-        )
-        
-        # Build content
-        content = []
+            # Create the PDF document
+            doc = SimpleDocTemplate(
+                output_path,
+                pagesize=letter,
+                rightMargin=1*inch,
+                leftMargin=1*inch,
+                topMargin=1*inch,
+                bottomMargin=1*inch
+            )
+            
+            # Chapters are read and laid out one at a time as pages are written
+            chapters = Chapter.iter_by_board_position(conn, story_id)
+            doc.build(_StreamedFlowables(
+                self._pdf_chunks(story, chapters, include_synopsis, draft_watermark)
+            ))
         
+        return output_path
+    
+    def _pdf_chunks(self, story: Story, chapters: Iterator[Chapter],
+                    include_synopsis: bool, draft_watermark: bool) -> Iterator[List]:
+        """Yield the PDF flowables for the title page and then each chapter."""
         # Title page
+        content = []
         content.append(Spacer(1, 2*inch))
         content.append(Paragraph(story.title, self.styles['BookTitle']))
         
@@ -189,10 +215,13 @@ class StoryPublisher:
                 self.styles['Synopsis']
             ))
         
-        content.append(PageBreak())
+        yield content
         
         # Chapters
         for i, chapter in enumerate(chapters):
+            # Page break before each chapter
+            content = [PageBreak()]
+            
             # Chapter title
             chapter_num = i + 1
             title_text = f"Chapter {chapter_num}: {chapter.title}"
@@ -212,14 +241,7 @@ class StoryPublisher:
                 style = self.styles['StoryBodyFirst'] if j == 0 else self.styles['StoryBody']
                 content.append(Paragraph(para, style))
             
-            # Page break between chapters (except last)
-            if i < len(chapters) - 1:
-                content.append(PageBreak())
-        
-        # Build the PDF
-        doc.build(content)
-        
-        return output_path
+            yield content
 
     def publish_rough_draft(self, story_id: int, output_dir: str) -> str:
         """
@@ -507,6 +529,26 @@ class StoryPublisher:
         return output_path
 
 
+@lru_cache(maxsize=4)
+def get_publisher(db_path: str) -> StoryPublisher:
+    """Return the shared publisher for a database.
+    
+    A publisher keeps no per-call state, so its stylesheet is built once and
+    reused by every publish instead of being rebuilt each time.
+    """
+    return StoryPublisher(db_path)
+
+
+@lru_cache(maxsize=256)
+def _text_stats(content: Optional[str]) -> Tuple[int, int]:
+    """Return the (word count, character count) of a chapter's HTML content.
+    
+    Keyed on the content itself, so an edited chapter is always recounted.
+    """
+    text = html_to_text(content)
+    return len(text.split()), len(text)
+
+
 def get_story_word_count(db_path: str, story_id: int) -> int:
     """Get total word count for a story."""
     with DatabaseManager(db_path) as conn:
@@ -514,14 +556,17 @@ def get_story_word_count(db_path: str, story_id: int) -> int:
     
     total_words = 0
     for chapter in chapters:
-        text = html_to_text(chapter.content)
-        total_words += len(text.split())
+        total_words += _text_stats(chapter.content)[0]
     
     return total_words
 
 
 def get_story_stats(db_path: str, story_id: int) -> dict:
-    """Get statistics for a story."""
+    """Get statistics for a story.
+    
+    Chapter text is only converted and counted when its content differs
+    from what was counted before.
+    """
     with DatabaseManager(db_path) as conn:
         story = Story.get_by_id(conn, story_id)
         chapters = Chapter.get_by_story(conn, story_id)
@@ -531,9 +576,7 @@ def get_story_stats(db_path: str, story_id: int) -> dict:
     chapter_stats = []
     
     for chapter in chapters:
-        text = html_to_text(chapter.content)
-        words = len(text.split())
-        chars = len(text)
+        words, chars = _text_stats(chapter.content)
         total_words += words
         total_chars += chars
         chapter_stats.append({
@@ -81,7 +81,6 @@ class AutoSaveSystem:
             # This is where we'd call the model's save method or database operations
             
             # Simulate a save operation
-            import time
             time.sleep(0.1)  # Simulate save delay
             
             self.last_save_time = current_time
@@ -0,0 +1,76 @@
+"""
+Background workers for BlueWriter views.
+Runs database reads and file I/O on the global QThreadPool so the UI stays responsive.
+"""
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable, Union
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by background workers; delivered on the receiver's thread."""
+
+    finished = Signal(object)  # Task result
+    failed = Signal(str)       # Error message
+
+
+class TaskWorker(QRunnable):
+    """Runs a callable on the global thread pool and reports its outcome.
+
+    The callable's return value is emitted through ``signals.finished``.
+    Any exception is reported via ``signals.failed`` instead of propagating
+    into the thread pool.
+    """
+
+    def __init__(self, task: Callable[[], Any]) -> None:
+        """Initialize the worker.
+
+        Args:
+            task: Callable taking no arguments and returning the result.
+        """
+        super().__init__()
+        self.task = task
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        """Run the task and emit its result or error."""
+        try:
+            result = self.task()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+    def start(self) -> None:
+        """Submit this worker to the global thread pool."""
+        QThreadPool.globalInstance().start(self)
+
+
+class QueryWorker(TaskWorker):
+    """Runs a read query against a private read-only SQLite connection.
+
+    The query callable receives the connection; its return value is
+    emitted through ``signals.finished``.
+    """
+
+    def __init__(self, db_path: Union[str, Path],
+                 query: Callable[[sqlite3.Connection], Any]) -> None:
+        """Initialize the worker.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            query: Callable taking a connection and returning the result.
+        """
+        super().__init__(self._run_query)
+        self.db_path = Path(db_path)
+        self.query = query
+
+    def _run_query(self) -> Any:
+        """Open a read-only connection and run the query on it."""
+        conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            return self.query(conn)
+        finally:
+            conn.close()
@@ -75,6 +75,7 @@ class DictionaryEditorDialog(QDialog):
     
     def load_words(self) -> None:
         """Load words from the custom dictionary."""
+        self.add_edit.clear()
         self.word_list.clear()
         for word in sorted(self.spell_checker.custom_words):
             self.word_list.addItem(word)
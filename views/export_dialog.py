@@ -2,6 +2,7 @@
 Export dialog for BlueWriter.
 Handles exporting projects to portable formats.
 """
+from functools import partial
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -15,6 +16,7 @@ from models.story import Story
 from models.encyclopedia_entry import EncyclopediaEntry
 from utils.export import ProjectExporter
 from database.connection import DatabaseManager, get_default_db_path
+from views.db_worker import TaskWorker
 
 
 class ExportDialog(QDialog):
@@ -24,11 +26,13 @@ class ExportDialog(QDialog):
         super().__init__(parent)
         self.project = project
         self.db_path = str(get_default_db_path())
+        self._worker = None
+        self._progress = None
         
-        self.setWindowTitle(f"Export: {project.name}")
         self.setMinimumWidth(450)
         
         self.setup_ui()
+        self.set_project(project)
     
     def setup_ui(self) -> None:
         """Set up the dialog UI."""
@@ -38,23 +42,16 @@ class ExportDialog(QDialog):
         info_group = QGroupBox("Project Information")
         info_layout = QVBoxLayout(info_group)
         
-        self.title_label = QLabel(f"<b>{self.project.name}</b>")
+        self.title_label = QLabel()
         info_layout.addWidget(self.title_label)
         
-        if self.project.description:
-            desc_label = QLabel(self.project.description)
-            desc_label.setWordWrap(True)
-            desc_label.setStyleSheet("color: gray;")
-            info_layout.addWidget(desc_label)
+        self.desc_label = QLabel()
+        self.desc_label.setWordWrap(True)
+        self.desc_label.setStyleSheet("color: gray;")
+        info_layout.addWidget(self.desc_label)
         
-        # Get counts
-        with DatabaseManager(self.db_path) as conn:
-            stories = Story.get_by_project(conn, self.project.id)
-            entries = EncyclopediaEntry.get_by_project(conn, self.project.id)
-        
-        counts_text = f"Stories: {len(stories)} | Encyclopedia Entries: {len(entries)}"
-        counts_label = QLabel(counts_text)
-        info_layout.addWidget(counts_label)
+        self.counts_label = QLabel()
+        info_layout.addWidget(self.counts_label)
         
         layout.addWidget(info_group)
         
@@ -97,12 +94,34 @@ class ExportDialog(QDialog):
         cancel_btn.clicked.connect(self.reject)
         btn_layout.addWidget(cancel_btn)
         
-        export_btn = QPushButton("Export...")
-        export_btn.clicked.connect(self.do_export)
-        btn_layout.addWidget(export_btn)
+        self.export_btn = QPushButton("Export...")
+        self.export_btn.clicked.connect(self.do_export)
+        btn_layout.addWidget(self.export_btn)
         
         layout.addLayout(btn_layout)
     
+    def set_project(self, project: Project) -> None:
+        """Show a project's details so a cached dialog can be reused for it.
+        
+        Args:
+            project: Project to export.
+        """
+        self.project = project
+        self.setWindowTitle(f"Export: {project.name}")
+        self.title_label.setText(f"<b>{project.name}</b>")
+        self.desc_label.setText(project.description or "")
+        self.desc_label.setVisible(bool(project.description))
+        
+        # Get counts
+        with DatabaseManager(self.db_path) as conn:
+            stories = Story.get_by_project(conn, project.id)
+            entries = EncyclopediaEntry.get_by_project(conn, project.id)
+        
+        self.counts_label.setText(
+            f"Stories: {len(stories)} | Encyclopedia Entries: {len(entries)}"
+        )
+        self.export_btn.setEnabled(True)
+    
     def do_export(self) -> None:
         """Execute the export process."""
         # Get save location
@@ -118,24 +137,34 @@ class ExportDialog(QDialog):
             return
         
         # Show progress
-        progress = QProgressDialog("Exporting...", None, 0, 0, self)
-        progress.setWindowModality(Qt.WindowModal)
-        progress.show()
-        
-        try:
-            exporter = ProjectExporter(self.db_path)
-            output_path = exporter.export_project(self.project.id, file_path)
-            
-            progress.close()
-            
-            QMessageBox.information(
-                self,
-                "Exported",
-                f"Successfully exported to:\n{output_path}"
-            )
-            
-            self.accept()
-            
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(self, "Error", f"Export failed:\n{str(e)}")
+        self._progress = QProgressDialog("Exporting...", None, 0, 0, self)
+        self._progress.setWindowModality(Qt.WindowModal)
+        self._progress.show()
+        self.export_btn.setEnabled(False)
+        
+        # Write the archive in the background so the UI keeps painting
+        exporter = ProjectExporter(self.db_path)
+        self._worker = TaskWorker(partial(exporter.export_project, self.project.id, file_path))
+        self._worker.signals.finished.connect(self._on_export_finished)
+        self._worker.signals.failed.connect(self._on_export_failed)
+        self._worker.start()
+    
+    def _on_export_finished(self, output_path: str) -> None:
+        """Handle a completed export."""
+        self._worker = None
+        self._progress.close()
+        
+        QMessageBox.information(
+            self,
+            "Exported",
+            f"Successfully exported to:\n{output_path}"
+        )
+        
+        self.accept()
+    
+    def _on_export_failed(self, message: str) -> None:
+        """Handle a failed export."""
+        self._worker = None
+        self._progress.close()
+        self.export_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Export failed:\n{message}")
@@ -2,16 +2,33 @@
 Formatting toolbar for BlueWriter chapter editor.
 Provides text formatting capabilities for chapter content.
 """
-from PySide6.QtWidgets import (QToolBar, QAction, QToolButton, QWidget, 
+from functools import partial
+
+from PySide6.QtWidgets import (QToolBar, QToolButton, QWidget, 
                              QComboBox, QSizePolicy)
-from PySide6.QtGui import (QFont, QTextCharFormat, QTextCursor, QFontDatabase,
-                          QTextListFormat, QKeySequence)
+from PySide6.QtGui import (QAction, QFont, QTextCharFormat, QTextCursor, QFontDatabase,
+                          QTextListFormat, QKeySequence, QIntValidator)
 from PySide6.QtCore import Qt
 
 
 class FormatToolbar(QToolBar):
     """Toolbar providing text formatting options for chapter editing."""
     
+    # (attribute, label, shortcut, handler, handler argument)
+    _ACTIONS = (
+        None,
+        ('bold_action', "Bold", QKeySequence.Bold, 'toggle_bold', None),
+        ('italic_action', "Italic", QKeySequence.Italic, 'toggle_italic', None),
+        ('underline_action', "Underline", QKeySequence.Underline, 'toggle_underline', None),
+        None,
+        ('align_left_action', "Align Left", None, 'set_alignment', Qt.AlignLeft),
+        ('align_center_action', "Align Center", None, 'set_alignment', Qt.AlignCenter),
+        ('align_right_action', "Align Right", None, 'set_alignment', Qt.AlignRight),
+        None,
+        ('bullet_list_action', "Bullet List", None, 'toggle_bullet_list', None),
+        ('numbered_list_action', "Numbered List", None, 'toggle_numbered_list', None),
+    )
+    
     def __init__(self, parent=None) -> None:
         """Initialize the formatting toolbar.
         
@@ -27,6 +44,7 @@ class FormatToolbar(QToolBar):
         self.font_size_combo.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.font_size_combo.setEditable(True)
         self.font_size_combo.setInsertPolicy(QComboBox.NoInsert)
+        self.font_size_combo.setValidator(QIntValidator(1, 999, self))
         
         # Add common font sizes
         font_sizes = [8, 9, 10, 11, 12, 14, 16, 18, 20, 22, 24, 26, 28, 36, 48, 72]
@@ -36,64 +54,27 @@ class FormatToolbar(QToolBar):
         # Add the combo box to toolbar
         self.addWidget(self.font_size_combo)
         
-        # Add separator
-        self.addSeparator()
-        
-        # Create text formatting actions
-        self.bold_action = QAction("Bold", self)
-        self.bold_action.setCheckable(True)
-        self.bold_action.setShortcut(QKeySequence.Bold)
-        self.addAction(self.bold_action)
-        
-        self.italic_action = QAction("Italic", self)
-        self.italic_action.setCheckable(True)
-        self.italic_action.setShortcut(QKeySequence.Italic)
-        self.addAction(self.italic_action)
-        
-        self.underline_action = QAction("Underline", self)
-        self.underline_action.setCheckable(True)
-        self.underline_action.setShortcut(QKeySequence.Underline)
-        self.addAction(self.underline_action)
-        
-        # Add separator
-        self.addSeparator()
-        
-        # Alignment actions
-        self.align_left_action = QAction("Align Left", self)
-        self.align_left_action.setCheckable(True)
-        self.addAction(self.align_left_action)
-        
-        self.align_center_action = QAction("Align Center", self)
-        self.align_center_action.setCheckable(True)
-        self.addAction(self.align_center_action)
-        
-        self.align_right_action = QAction("Align Right", self)
-        self.align_right_action.setCheckable(True)
-        self.addAction(self.align_right_action)
-        
-        # Add separator
-        self.addSeparator()
-        
-        # List actions
-        self.bullet_list_action = QAction("Bullet List", self)
-        self.bullet_list_action.setCheckable(True)
-        self.addAction(self.bullet_list_action)
-        
-        self.numbered_list_action = QAction("Numbered List", self)
-        self.numbered_list_action.setCheckable(True)
-        self.addAction(self.numbered_list_action)
-        
-        # Connect signals
-        self.bold_action.triggered.connect(self.toggle_bold)
-        self.italic_action.triggered.connect(self.toggle_italic)
-        self.underline_action.triggered.connect(self.toggle_underline)
-        self.align_left_action.triggered.connect(lambda: self.set_alignment(Qt.AlignLeft))
-        self.align_center_action.triggered.connect(lambda: self.set_alignment(Qt.AlignCenter))
-        self.align_right_action.triggered.connect(lambda: self.set_alignment(Qt.AlignRight))
-        self.bullet_list_action.triggered.connect(self.toggle_bullet_list)
-        self.numbered_list_action.triggered.connect(self.toggle_numbered_list)
+        # Create checkable formatting actions from the table; None marks a separator
+        for spec in self._ACTIONS:
+            if spec is None:
+                self.addSeparator()
+                continue
+            attr, label, shortcut, handler, arg = spec
+            action = QAction(label, self)
+            action.setCheckable(True)
+            if shortcut is not None:
+                action.setShortcut(shortcut)
+            slot = getattr(self, handler)
+            action.triggered.connect(slot if arg is None else partial(slot, arg))
+            setattr(self, attr, action)
+            self.addAction(action)
+        
         self.font_size_combo.currentTextChanged.connect(self.change_font_size)
         
+        # Editor being formatted and last (bold, italic, underline, size) shown
+        self.text_edit = None
+        self._last_fmt_state = None
+        
         # Set initial state
         self.update_formatting_buttons()
     
@@ -104,12 +85,14 @@ class FormatToolbar(QToolBar):
             text_edit: QTextEdit widget to format.
         """
         self.text_edit = text_edit
+        self._last_fmt_state = None
         # Connect text edit signals for real-time button updates
         if hasattr(self.text_edit, 'cursorPositionChanged'):
             self.text_edit.cursorPositionChanged.connect(self.update_formatting_buttons)
     
     def toggle_bold(self) -> None:
         """Toggle bold formatting."""
+        self._last_fmt_state = None  # The clicked widget changed its own state
         if not self.text_edit:
             return
             
@@ -123,6 +106,7 @@ class FormatToolbar(QToolBar):
     
     def toggle_italic(self) -> None:
         """Toggle italic formatting."""
+        self._last_fmt_state = None  # The clicked widget changed its own state
         if not self.text_edit:
             return
             
@@ -136,6 +120,7 @@ class FormatToolbar(QToolBar):
     
     def toggle_underline(self) -> None:
         """Toggle underline formatting."""
+        self._last_fmt_state = None  # The clicked widget changed its own state
         if not self.text_edit:
             return
             
@@ -160,58 +145,46 @@ class FormatToolbar(QToolBar):
     
     def toggle_bullet_list(self) -> None:
         """Toggle bullet list formatting."""
-        if not self.text_edit:
-            return
-            
-        cursor = self.text_edit.textCursor()
-        block_format = cursor.blockFormat()
-        
-        # Check if current line is part of a list
-        if block_format.objectType() == QTextListFormat.List:
-            # Remove list formatting
-            cursor.beginEditBlock()
-            cursor.select(QTextCursor.BlockUnderCursor)
-            cursor.setBlockFormat(QTextCharFormat())
-            cursor.endEditBlock()
-        else:
-            # Create bullet list
-            cursor.beginEditBlock()
-            cursor.select(QTextCursor.BlockUnderCursor)
-            list_format = QTextListFormat()
-            list_format.setStyle(QTextListFormat.ListDisc)
-            cursor.createList(list_format)
-            cursor.endEditBlock()
+        self._toggle_list(QTextListFormat.ListDisc)
     
     def toggle_numbered_list(self) -> None:
         """Toggle numbered list formatting."""
+        self._toggle_list(QTextListFormat.ListDecimal)
+    
+    def _toggle_list(self, style) -> None:
+        """Remove the current block from its list, or start a list of the given style.
+        
+        Args:
+            style: QTextListFormat style used when creating a new list.
+        """
         if not self.text_edit:
             return
             
         cursor = self.text_edit.textCursor()
-        block_format = cursor.blockFormat()
+        current_list = cursor.currentList()
         
-        # Check if current line is part of a list
-        if block_format.objectType() == QTextListFormat.List:
-            # Remove list formatting
-            cursor.beginEditBlock()
-            cursor.select(QTextCursor.BlockUnderCursor)
-            cursor.setBlockFormat(QTextCharFormat())
-            cursor.endEditBlock()
+        cursor.beginEditBlock()
+        if current_list is not None:
+            # Unlist only this block, keeping its alignment and indent
+            current_list.remove(cursor.block())
         else:
-            # Create numbered list
-            cursor.beginEditBlock()
-            cursor.select(QTextCursor.BlockUnderCursor)
             list_format = QTextListFormat()
-            list_format.setStyle(QTextListFormat.ListDecimal)
+            list_format.setStyle(style)
             cursor.createList(list_format)
-            cursor.endEditBlock()
+        cursor.endEditBlock()
     
     def change_font_size(self, size_str) -> None:
         """Change font size."""
-        if not self.text_edit or not size_str.isdigit():
+        self._last_fmt_state = None  # The clicked widget changed its own state
+        if not self.text_edit:
             return
-            
-        size = int(size_str)
+        
+        # The combo's validator only admits digits; the text may still be empty mid-edit
+        try:
+            size = int(size_str)
+        except ValueError:
+            return
+        
         cursor = self.text_edit.textCursor()
         char_format = cursor.charFormat()
         font = char_format.font()
@@ -229,6 +202,12 @@ class FormatToolbar(QToolBar):
         char_format = cursor.charFormat()
         font = char_format.font()
         
+        # Skip widget writes when the cursor stays within identical formatting
+        state = (font.bold(), font.italic(), font.underline(), font.pointSize())
+        if state == self._last_fmt_state:
+            return
+        self._last_fmt_state = state
+        
         # Update bold button
         self.bold_action.setChecked(font.bold())
         
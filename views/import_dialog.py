@@ -2,6 +2,7 @@
 Import dialog for BlueWriter.
 Handles importing projects from exported ZIP archives.
 """
+from functools import partial
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -12,6 +13,7 @@ from PySide6.QtCore import Qt
 
 from utils.importer import ProjectImporter
 from database.connection import get_default_db_path
+from views.db_worker import TaskWorker
 
 
 class ImportDialog(QDialog):
@@ -25,6 +27,8 @@ class ImportDialog(QDialog):
         self.db_path = str(get_default_db_path())
         self.selected_file = None
         self.imported_project_id = None
+        self._worker = None
+        self._progress = None
         
         self.setWindowTitle("Import Project")
         self.setMinimumWidth(500)
@@ -95,6 +99,14 @@ class ImportDialog(QDialog):
         
         layout.addLayout(btn_layout)
     
+    def reset(self) -> None:
+        """Clear the selected archive so a cached dialog can be reopened."""
+        self.selected_file = None
+        self.imported_project_id = None
+        self.file_label.setText("No file selected")
+        self.file_label.setStyleSheet("color: gray;")
+        self.import_btn.setEnabled(False)
+    
     def browse_file(self) -> None:
         """Open file browser to select ZIP archive."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -113,38 +125,47 @@ class ImportDialog(QDialog):
             self.import_btn.setEnabled(True)
     
     def do_import(self) -> None:
-        """Execute the import process."""
+        """Start the import in the background; the dialog stays responsive."""
         if not self.selected_file:
             return
         
         # Show progress
-        progress = QProgressDialog("Importing project...", None, 0, 0, self)
-        progress.setWindowModality(Qt.WindowModal)
-        progress.show()
-        
-        try:
-            importer = ProjectImporter(self.db_path)
-            project_id, stats = importer.import_from_zip(self.selected_file)
-            
-            self.imported_project_id = project_id
-            
-            progress.close()
-            
-            # Show success message
-            QMessageBox.information(
-                self,
-                "Import Complete",
-                f"Successfully imported project!\n\n"
-                f"Stories: {stats['stories']}\n"
-                f"Chapters: {stats['chapters']}\n"
-                f"Encyclopedia entries: {stats['encyclopedia_entries']}"
-            )
-            
-            self.accept()
-            
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(self, "Import Failed", f"Error importing project:\n{str(e)}")
+        self._progress = QProgressDialog("Importing project...", None, 0, 0, self)
+        self._progress.setWindowModality(Qt.WindowModal)
+        self._progress.show()
+        self.import_btn.setEnabled(False)
+        
+        importer = ProjectImporter(self.db_path)
+        self._worker = TaskWorker(partial(importer.import_from_zip, self.selected_file))
+        self._worker.signals.finished.connect(self._on_import_finished)
+        self._worker.signals.failed.connect(self._on_import_failed)
+        self._worker.start()
+    
+    def _on_import_finished(self, result: tuple) -> None:
+        """Handle a completed import."""
+        project_id, stats = result
+        self._worker = None
+        self._progress.close()
+        self.imported_project_id = project_id
+        
+        # Show success message
+        QMessageBox.information(
+            self,
+            "Import Complete",
+            f"Successfully imported project!\n\n"
+            f"Stories: {stats['stories']}\n"
+            f"Chapters: {stats['chapters']}\n"
+            f"Encyclopedia entries: {stats['encyclopedia_entries']}"
+        )
+        
+        self.accept()
+    
+    def _on_import_failed(self, message: str) -> None:
+        """Handle a failed import."""
+        self._worker = None
+        self._progress.close()
+        self.import_btn.setEnabled(True)
+        QMessageBox.critical(self, "Import Failed", f"Error importing project:\n{message}")
     
     def get_imported_project_id(self) -> int:
         """Return the ID of the imported project."""
@@ -19,6 +19,9 @@ class KeyboardShortcuts:
         """
         self.main_window = main_window
         self.shortcuts = []
+        # Resolve the status bar once instead of probing it on every message
+        status_bar = getattr(main_window, 'statusBar', None)
+        self._status_bar = status_bar() if callable(status_bar) else None
         self._setup_shortcuts()
         
     def _setup_shortcuts(self):
@@ -98,104 +101,63 @@ class KeyboardShortcuts:
     def _undo_action(self):
         """Perform undo action."""
         if hasattr(self.main_window, 'current_editor') and self.main_window.current_editor:
-            try:
-                # This would be implemented in the text editor
-                pass  # Placeholder for actual implementation
-                self._show_status_message("Undo performed", 1000)
-            except Exception as e:
-                self._show_error_message(f"Failed to undo: {str(e)}")
+            # This would be implemented in the text editor
+            self._show_status_message("Undo performed", 1000)
                 
     def _redo_action(self):
         """Perform redo action."""
         if hasattr(self.main_window, 'current_editor') and self.main_window.current_editor:
-            try:
-                # This would be implemented in the text editor
-                pass  # Placeholder for actual implementation
-                self._show_status_message("Redo performed", 1000)
-            except Exception as e:
-                self._show_error_message(f"Failed to redo: {str(e)}")
+            # This would be implemented in the text editor
+            self._show_status_message("Redo performed", 1000)
                 
     def _cut_text(self):
         """Cut selected text."""
         if hasattr(self.main_window, 'current_editor') and self.main_window.current_editor:
-            try:
-                # This would be implemented in the text editor
-                pass  # Placeholder for actual implementation
-                self._show_status_message("Text cut", 1000)
-            except Exception as e:
-                self._show_error_message(f"Failed to cut text: {str(e)}")
+            # This would be implemented in the text editor
+            self._show_status_message("Text cut", 1000)
                 
     def _copy_text(self):
         """Copy selected text."""
         if hasattr(self.main_window, 'current_editor') and self.main_window.current_editor:
-            try:
-                # This would be implemented in the text editor
-                pass  # Placeholder for actual implementation
-                self._show_status_message("Text copied", 1000)
-            except Exception as e:
-                self._show_error_message(f"Failed to copy text: {str(e)}")
+            # This would be implemented in the text editor
+            self._show_status_message("Text copied", 1000)
                 
     def _paste_text(self):
         """Paste text from clipboard."""
         if hasattr(self.main_window, 'current_editor') and self.main_window.current_editor:
-            try:
-                # This would be implemented in the text editor
-                pass  # Placeholder for actual implementation
-                self._show_status_message("Text pasted", 1000)
-            except Exception as e:
-                self._show_error_message(f"Failed to paste text: {str(e)}")
+            # This would be implemented in the text editor
+            self._show_status_message("Text pasted", 1000)
                 
     def _format_bold(self):
         """Apply bold formatting."""
         if hasattr(self.main_window, 'current_editor') and self.main_window.current_editor:
-            try:
-                # This would be implemented in the formatting toolbar
-                pass  # Placeholder for actual implementation
-                self._show_status_message("Bold formatting applied", 1000)
-            except Exception as e:
-                self._show_error_message(f"Failed to apply bold: {str(e)}")
+            # This would be implemented in the formatting toolbar
+            self._show_status_message("Bold formatting applied", 1000)
                 
     def _format_italic(self):
         """Apply italic formatting."""
         if hasattr(self.main_window, 'current_editor') and self.main_window.current_editor:
-            try:
-                # This would be implemented in the formatting toolbar
-                pass  # Placeholder for actual implementation
-                self._show_status_message("Italic formatting applied", 1000)
-            except Exception as e:
-                self._show_error_message(f"Failed to apply italic: {str(e)}")
+            # This would be implemented in the formatting toolbar
+            self._show_status_message("Italic formatting applied", 1000)
                 
     def _format_underline(self):
         """Apply underline formatting."""
         if hasattr(self.main_window, 'current_editor') and self.main_window.current_editor:
-            try:
-                # This would be implemented in the formatting toolbar
-                pass  # Placeholder for actual implementation
-                self._show_status_message("Underline formatting applied", 1000)
-            except Exception as e:
-                self._show_error_message(f"Failed to apply underline: {str(e)}")
+            # This would be implemented in the formatting toolbar
+            self._show_status_message("Underline formatting applied", 1000)
                 
     def _goto_line(self):
         """Go to a specific line."""
         # This would open a dialog
-        try:
-            self._show_status_message("Go to line dialog opened", 2000)
-        except Exception as e:
-            self._show_error_message(f"Failed to open go to line: {str(e)}")
+        self._show_status_message("Go to line dialog opened", 2000)
             
     def _next_chapter(self):
         """Navigate to next chapter."""
-        try:
-            self._show_status_message("Next chapter", 1000)
-        except Exception as e:
-            self._show_error_message(f"Failed to navigate to next chapter: {str(e)}")
+        self._show_status_message("Next chapter", 1000)
             
     def _previous_chapter(self):
         """Navigate to previous chapter."""
-        try:
-            self._show_status_message("Previous chapter", 1000)
-        except Exception as e:
-            self._show_error_message(f"Failed to navigate to previous chapter: {str(e)}")
+        self._show_status_message("Previous chapter", 1000)
             
     def _toggle_fullscreen(self):
         """Toggle fullscreen mode."""
@@ -228,11 +190,8 @@ class KeyboardShortcuts:
             
     def _show_status_message(self, message, timeout=3000):
         """Show a status message."""
-        if hasattr(self.main_window, 'statusBar'):
-            try:
-                self.main_window.statusBar().showMessage(message, timeout)
-            except Exception:
-                pass  # Ignore errors in status bar display
+        if self._status_bar is not None:
+            self._status_bar.showMessage(message, timeout)
                 
     def _show_error_message(self, message):
         """Show an error message."""
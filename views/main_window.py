@@ -2,12 +2,16 @@
 Main window for BlueWriter application.
 Integrates all UI components: sidebar, timeline canvas, and dialogs.
 """
+from functools import partial
+from operator import attrgetter
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QMainWindow, QStatusBar, QToolBar, QWidget, QVBoxLayout,
     QHBoxLayout, QSplitter, QLabel, QPushButton, QMessageBox
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QAction
+from PySide6.QtCore import Qt, QSize, QTimer
+from PySide6.QtGui import QAction, QRegion
 
 from views.timeline_canvas import TimelineCanvas
 from views.story_manager import StoryManagerWidget
@@ -19,6 +23,7 @@ from views.dictionary_editor import DictionaryEditorDialog
 from views.publish_dialog import PublishDialog, UnpublishDialog
 from views.export_dialog import ExportDialog
 from views.import_dialog import ImportDialog
+from views.db_worker import QueryWorker
 from database.connection import DatabaseManager, get_default_db_path
 from database.schema import create_all_tables
 from models.project import Project
@@ -31,16 +36,63 @@ from adapters.qt_adapter import QtEventAdapter
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    # (attribute, label, shortcut, slot, enabled) per action; None adds a
+    # separator and a (title, entries) pair adds a submenu
+    _MENUS = (
+        ("&File", (
+            (None, "&New Project", "Ctrl+N", 'new_project', True),
+            (None, "&Open Project", "Ctrl+O", 'open_project', True),
+            (None, "&Import Project...", "Ctrl+I", 'import_project', True),
+            None,
+            (None, "&Save", "Ctrl+S", 'save_project', True),
+            None,
+            ("&Publish", (
+                ('publish_story_action', "Publish Current Story...", None, 'publish_story', False),
+                ('unpublish_story_action', "Unpublish Current Story...", None, 'unpublish_story', False),
+            )),
+            ('export_action', "&Export Project...", "Ctrl+E", 'export_project', False),
+            None,
+            (None, "E&xit", "Ctrl+Q", 'close', True),
+        )),
+        ("&Edit", (
+            (None, "&Undo", "Ctrl+Z", None, True),
+            (None, "&Redo", "Ctrl+Y", None, True),
+            None,
+            (None, "Custom &Dictionary...", None, 'open_dictionary_editor', True),
+        )),
+        ("&View", (
+            (None, "Zoom &In", "+", 'canvas.zoom_in', True),
+            (None, "Zoom &Out", "-", 'canvas.zoom_out', True),
+            (None, "&Reset Zoom", "Ctrl+0", 'canvas.reset_zoom', True),
+        )),
+        ("&Help", (
+            (None, "&About", None, 'show_about', True),
+        )),
+    )
+    
+    # Notes are only built for chapters within this many pixels of the viewport
+    _NOTE_CULL_MARGIN = 200
+    
+    # How long background notices (e.g. auto-saves) stay in the status bar
+    _TRANSIENT_STATUS_MS = 2000
+    
+    # New Chapter stays disabled until a story is selected
+    _TOOLBAR = (
+        ('new_chapter_action', "New Chapter", "Ctrl+Shift+N", 'add_chapter', False),
+        None,
+        (None, "Refresh", None, 'refresh_canvas', True),
+    )
+    
     def __init__(self) -> None:
         """Initialize the main window."""
         super().__init__()
         self.setWindowTitle("BlueWriter")
         self.setMinimumSize(QSize(1200, 800))
         
-        # Initialize database
+        # Initialize database; one connection is kept open for the window's lifetime
         self.db_manager = DatabaseManager(get_default_db_path())
-        with self.db_manager as conn:
-            create_all_tables(conn)
+        self.conn = self.db_manager.connect_shared()
+        create_all_tables(self.conn)
         
         # Initialize service layer and API
         self._init_services()
@@ -48,9 +100,32 @@ class MainWindow(QMainWindow):
         # Current state
         self.current_project_id = None
         self.current_story_id = None
-        self.sticky_notes = []  # Track sticky note widgets
+        self._chapters = {}  # Chapters of the current story: {chapter_id: Chapter}
+        self.sticky_notes = {}  # Notes for on-screen chapters: {chapter_id: StickyNote}
         self.open_editors = {}  # Track open chapter editors: {chapter_id: ChapterEditorDock}
         
+        # Dialogs are built on first use and reused afterwards
+        self._project_dialog = None
+        self._import_dialog = None
+        self._export_dialog = None
+        self._dictionary_dialog = None
+        
+        # Rows already read this session; dropped when they change
+        self._story_cache = {}  # {story_id: Story}
+        self._project_cache = {}  # {project_id: Project}
+        self._chapter_counts = {}  # {story_id: chapter count}
+        
+        # Sticky-note moves are coalesced and written in one batch
+        self._pending_moves = {}  # {chapter_id: (board_x, board_y)}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(150)
+        self._flush_timer.timeout.connect(self._flush_positions)
+        
+        # Chapter loads run in the thread pool; only the latest request is applied
+        self._chapter_worker = None
+        self._chapter_load_token = 0
+        
         # Create UI components
         self.setup_ui()
         self.create_menus()
@@ -94,29 +169,69 @@ class MainWindow(QMainWindow):
         
         # Story events - update sidebar when stories change
         self.event_adapter.story_selected.connect(self._on_service_story_selected)
+        
+        # Drop cached rows that services have modified
+        self.event_adapter.story_updated.connect(self._invalidate_story)
+        self.event_adapter.story_deleted.connect(self._invalidate_story)
+        self.event_adapter.story_published.connect(self._invalidate_story)
+        self.event_adapter.story_unpublished.connect(self._invalidate_story)
+        self.event_adapter.project_updated.connect(self._invalidate_project)
+        self.event_adapter.project_deleted.connect(self._invalidate_project)
+    
+    def _get_story(self, story_id: int) -> Optional[Story]:
+        """Return a story, reading it from the database only on a cache miss."""
+        story = self._story_cache.get(story_id)
+        if story is None:
+            story = Story.get_by_id(self.conn, story_id)
+            if story:
+                self._story_cache[story_id] = story
+        return story
+    
+    def _get_project(self, project_id: int) -> Optional[Project]:
+        """Return a project, reading it from the database only on a cache miss."""
+        project = self._project_cache.get(project_id)
+        if project is None:
+            project = Project.get_by_id(self.conn, project_id)
+            if project:
+                self._project_cache[project_id] = project
+        return project
+    
+    def _chapter_count(self, story_id: int) -> int:
+        """Return a story's chapter count, counting in the database only on a cache miss."""
+        if story_id not in self._chapter_counts:
+            self._chapter_counts[story_id] = Chapter.count_by_story(self.conn, story_id)
+        return self._chapter_counts[story_id]
+    
+    def _invalidate_story(self, story_id: int, *args) -> None:
+        """Drop a story from the cache so the next lookup rereads it."""
+        self._story_cache.pop(story_id, None)
+    
+    def _invalidate_project(self, project_id: int, *args) -> None:
+        """Drop a project from the cache so the next lookup rereads it."""
+        self._project_cache.pop(project_id, None)
     
     def _on_service_chapter_created(
         self, chapter_id: int, story_id: int, title: str, 
         board_x: int, board_y: int, color: str
     ) -> None:
         """Handle chapter created by service (e.g., from API/MCP)."""
+        self._chapter_counts.pop(story_id, None)
         if story_id == self.current_story_id:
             # Reload the chapter from DB and add to canvas
-            with self.db_manager as conn:
-                chapter = Chapter.get_by_id(conn, chapter_id)
-                if chapter:
-                    self.add_sticky_note(chapter)
+            chapter = Chapter.get_by_id(self.conn, chapter_id)
+            if chapter:
+                self._chapters[chapter.id] = chapter
+                self._refresh_visible_notes()
     
     def _on_service_chapter_deleted(self, chapter_id: int, story_id: int) -> None:
         """Handle chapter deleted by service."""
+        self._chapter_counts.pop(story_id, None)
         if story_id == self.current_story_id:
             # Find and remove the sticky note
-            for note in self.sticky_notes[:]:
-                if note.chapter.id == chapter_id:
-                    note.setParent(None)
-                    note.deleteLater()
-                    self.sticky_notes.remove(note)
-                    break
+            self._chapters.pop(chapter_id, None)
+            note = self.sticky_notes.pop(chapter_id, None)
+            if note is not None:
+                self._remove_sticky_note(note)
             # Close editor if open
             if chapter_id in self.open_editors:
                 self.open_editors[chapter_id].close()
@@ -126,33 +241,39 @@ class MainWindow(QMainWindow):
         new_x: int, new_y: int
     ) -> None:
         """Handle chapter moved by service."""
-        for note in self.sticky_notes:
-            if note.chapter.id == chapter_id:
-                # Update the note's position
-                note.chapter.board_x = new_x
-                note.chapter.board_y = new_y
-                screen_x, screen_y = self.canvas.canvas_to_screen(new_x, new_y)
-                note.move(int(screen_x), int(screen_y))
-                break
+        chapter = self._chapters.get(chapter_id)
+        if chapter is None:
+            return
+        chapter.board_x = new_x
+        chapter.board_y = new_y
+        
+        note = self.sticky_notes.get(chapter_id)
+        if note is not None:
+            # Update the note's position
+            note.set_canvas_position(new_x, new_y)
+            screen_x, screen_y = self.canvas.canvas_to_screen(new_x, new_y)
+            note.move(int(screen_x), int(screen_y))
+        # The move may take the note on or off screen
+        self._refresh_visible_notes()
     
     def _on_service_chapter_color_changed(
         self, chapter_id: int, old_color: str, new_color: str
     ) -> None:
         """Handle chapter color changed by service."""
-        for note in self.sticky_notes:
-            if note.chapter.id == chapter_id:
-                note.chapter.color = new_color
-                note.update_color()
-                break
+        chapter = self._chapters.get(chapter_id)
+        if chapter is not None:
+            chapter.color = new_color
+        note = self.sticky_notes.get(chapter_id)
+        if note is not None:
+            note.update()
     
     def _on_service_story_selected(self, story_id: int) -> None:
         """Handle story selected by service."""
         if story_id != self.current_story_id:
             # Load the story - this will update the canvas
-            with self.db_manager as conn:
-                story = Story.get_by_id(conn, story_id)
-                if story:
-                    self.load_story(story)
+            story = self._get_story(story_id)
+            if story:
+                self.load_story(story)
 
     def setup_ui(self) -> None:
         """Set up the main UI layout with sidebar and canvas."""
@@ -188,6 +309,7 @@ class MainWindow(QMainWindow):
         # Right side: Timeline canvas
         self.canvas = TimelineCanvas()
         self.canvas.new_chapter_requested.connect(self.add_chapter_at_position)
+        self.canvas.viewport_changed.connect(self._refresh_visible_notes)
         
         # Add to splitter
         self.splitter.addWidget(self.sidebar_container)
@@ -199,138 +321,68 @@ class MainWindow(QMainWindow):
     def create_menus(self) -> None:
         """Create all menu items with connected actions."""
         menubar = self.menuBar()
-        
-        # === File menu ===
-        file_menu = menubar.addMenu("&File")
-        
-        new_project_action = QAction("&New Project", self)
-        new_project_action.setShortcut("Ctrl+N")
-        new_project_action.triggered.connect(self.new_project)
-        file_menu.addAction(new_project_action)
-        
-        open_project_action = QAction("&Open Project", self)
-        open_project_action.setShortcut("Ctrl+O")
-        open_project_action.triggered.connect(self.open_project)
-        file_menu.addAction(open_project_action)
-        
-        import_project_action = QAction("&Import Project...", self)
-        import_project_action.setShortcut("Ctrl+I")
-        import_project_action.triggered.connect(self.import_project)
-        file_menu.addAction(import_project_action)
-        
-        file_menu.addSeparator()
-        
-        save_action = QAction("&Save", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self.save_project)
-        file_menu.addAction(save_action)
-        
-        file_menu.addSeparator()
-        
-        # Publish submenu
-        publish_menu = file_menu.addMenu("&Publish")
-        
-        self.publish_story_action = QAction("Publish Current Story...", self)
-        self.publish_story_action.triggered.connect(self.publish_story)
-        self.publish_story_action.setEnabled(False)
-        publish_menu.addAction(self.publish_story_action)
-        
-        self.unpublish_story_action = QAction("Unpublish Current Story...", self)
-        self.unpublish_story_action.triggered.connect(self.unpublish_story)
-        self.unpublish_story_action.setEnabled(False)
-        publish_menu.addAction(self.unpublish_story_action)
-        
-        # Export
-        self.export_action = QAction("&Export Project...", self)
-        self.export_action.setShortcut("Ctrl+E")
-        self.export_action.triggered.connect(self.export_project)
-        self.export_action.setEnabled(False)
-        file_menu.addAction(self.export_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # === Edit menu ===
-        edit_menu = menubar.addMenu("&Edit")
-        
-        undo_action = QAction("&Undo", self)
-        undo_action.setShortcut("Ctrl+Z")
-        edit_menu.addAction(undo_action)
-        
-        redo_action = QAction("&Redo", self)
-        redo_action.setShortcut("Ctrl+Y")
-        edit_menu.addAction(redo_action)
-        
-        edit_menu.addSeparator()
-        
-        dictionary_action = QAction("Custom &Dictionary...", self)
-        dictionary_action.triggered.connect(self.open_dictionary_editor)
-        edit_menu.addAction(dictionary_action)
-        
-        # === View menu ===
-        view_menu = menubar.addMenu("&View")
-        
-        zoom_in_action = QAction("Zoom &In", self)
-        zoom_in_action.setShortcut("+")
-        zoom_in_action.triggered.connect(self.canvas.zoom_in)
-        view_menu.addAction(zoom_in_action)
-        
-        zoom_out_action = QAction("Zoom &Out", self)
-        zoom_out_action.setShortcut("-")
-        zoom_out_action.triggered.connect(self.canvas.zoom_out)
-        view_menu.addAction(zoom_out_action)
-        
-        reset_zoom_action = QAction("&Reset Zoom", self)
-        reset_zoom_action.setShortcut("Ctrl+0")
-        reset_zoom_action.triggered.connect(self.canvas.reset_zoom)
-        view_menu.addAction(reset_zoom_action)
-        
-        # === Help menu ===
-        help_menu = menubar.addMenu("&Help")
-        
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        for title, entries in self._MENUS:
+            self._add_actions(menubar.addMenu(title), entries)
 
     def create_toolbars(self) -> None:
         """Create toolbars with chapter actions."""
         toolbar = QToolBar("Main Toolbar")
         toolbar.setMovable(False)
         self.addToolBar(toolbar)
-        
-        # New Chapter button
-        self.new_chapter_action = QAction("New Chapter", self)
-        self.new_chapter_action.setShortcut("Ctrl+Shift+N")
-        self.new_chapter_action.triggered.connect(self.add_chapter)
-        self.new_chapter_action.setEnabled(False)  # Disabled until story selected
-        toolbar.addAction(self.new_chapter_action)
-        
-        toolbar.addSeparator()
-        
-        # Refresh button
-        refresh_action = QAction("Refresh", self)
-        refresh_action.triggered.connect(self.refresh_canvas)
-        toolbar.addAction(refresh_action)
+        self._add_actions(toolbar, self._TOOLBAR)
+    
+    def _add_actions(self, container, entries: tuple) -> None:
+        """Build actions from a spec table and add them to a menu or toolbar.
+        
+        Args:
+            container: QMenu or QToolBar receiving the actions.
+            entries: Entries as in ``_MENUS``.
+        """
+        for spec in entries:
+            if spec is None:
+                container.addSeparator()
+                continue
+            if len(spec) == 2:
+                title, sub_entries = spec
+                self._add_actions(container.addMenu(title), sub_entries)
+                continue
+            attr, label, shortcut, slot, enabled = spec
+            action = QAction(label, self)
+            if shortcut is not None:
+                action.setShortcut(shortcut)
+            if slot is not None:
+                action.triggered.connect(attrgetter(slot)(self))
+            action.setEnabled(enabled)
+            if attr is not None:
+                setattr(self, attr, action)
+            container.addAction(action)
     
     def new_project(self) -> None:
         """Open dialog to create a new project."""
-        dialog = ProjectBrowserDialog(self)
-        dialog.project_selected.connect(self.load_project)
-        dialog.exec()
+        self._show_project_dialog()
     
     def open_project(self) -> None:
         """Open dialog to select an existing project."""
-        dialog = ProjectBrowserDialog(self)
-        dialog.project_selected.connect(self.load_project)
-        dialog.exec()
+        self._show_project_dialog()
+    
+    def _show_project_dialog(self) -> None:
+        """Show the project browser, creating it on first use."""
+        if self._project_dialog is None:
+            self._project_dialog = ProjectBrowserDialog(
+                self, db_manager=self.db_manager, conn=self.conn
+            )
+            self._project_dialog.project_selected.connect(self.load_project, Qt.UniqueConnection)
+        else:
+            self._project_dialog.reset()
+        self._project_dialog.exec()
     
     def import_project(self, checked: bool = False) -> None:
         """Open dialog to import a project from ZIP archive."""
-        dialog = ImportDialog(self)
+        if self._import_dialog is None:
+            self._import_dialog = ImportDialog(self)
+        else:
+            self._import_dialog.reset()
+        dialog = self._import_dialog
         if dialog.exec():
             project_id = dialog.get_imported_project_id()
             if project_id:
@@ -342,13 +394,14 @@ class MainWindow(QMainWindow):
         self.current_story_id = None
         
         # Get project info for title
-        with self.db_manager as conn:
-            project = Project.get_by_id(conn, project_id)
-            if project:
-                self.setWindowTitle(f"BlueWriter - {project.name}")
+        self._invalidate_project(project_id)
+        project = self._get_project(project_id)
+        if project:
+            self.setWindowTitle(f"BlueWriter - {project.name}")
         
         # Clear old sidebar content
         if self.story_manager:
+            self.story_manager.flush_pending_saves()
             self.sidebar_layout.removeWidget(self.story_manager)
             self.story_manager.deleteLater()
         
@@ -360,13 +413,17 @@ class MainWindow(QMainWindow):
         self.welcome_label.hide()
         
         # Create story manager for this project (top of sidebar)
-        self.story_manager = StoryManagerWidget(project_id, self)
+        self.story_manager = StoryManagerWidget(project_id, self, conn=self.conn)
         self.story_manager.story_selected.connect(self.on_story_selected)
+        self.story_manager.status_message.connect(self._show_transient_status)
+        self.story_manager.story_changed.connect(self._invalidate_story)
         self.sidebar_layout.insertWidget(0, self.story_manager)
         
-        # Create encyclopedia widget (bottom of sidebar)
-        self.encyclopedia_widget = EncyclopediaWidget(project_id, self)
+        # Encyclopedia (bottom of sidebar) is built once the canvas has painted
+        self.encyclopedia_widget = QLabel("Loading encyclopedia...")
+        self.encyclopedia_widget.setAlignment(Qt.AlignCenter)
         self.sidebar_layout.addWidget(self.encyclopedia_widget)
+        QTimer.singleShot(50, partial(self._create_encyclopedia, project_id))
         
         # Enable export action
         self.export_action.setEnabled(True)
@@ -374,44 +431,133 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage(f"Project loaded. Create or select a story.")
         self.clear_canvas()
     
+    def _create_encyclopedia(self, project_id: int) -> None:
+        """Replace the encyclopedia placeholder with the real widget."""
+        if project_id != self.current_project_id:
+            return  # Another project was opened in the meantime
+        if isinstance(self.encyclopedia_widget, EncyclopediaWidget):
+            return  # Already built by an earlier call for this project
+        
+        self.sidebar_layout.removeWidget(self.encyclopedia_widget)
+        self.encyclopedia_widget.deleteLater()
+        self.encyclopedia_widget = EncyclopediaWidget(project_id, self)
+        self.sidebar_layout.addWidget(self.encyclopedia_widget)
+    
     def on_story_selected(self, story_id: int) -> None:
         """Handle story selection - load chapters onto canvas."""
         self.current_story_id = story_id
         self.new_chapter_action.setEnabled(True)
         self.load_chapters()
         
-        with self.db_manager as conn:
-            story = Story.get_by_id(conn, story_id)
-            if story:
-                self.status_bar.showMessage(f"Editing: {story.title}")
-                
-                # Update publish action states
-                self.publish_story_action.setEnabled(not story.is_locked)
-                self.unpublish_story_action.setEnabled(story.is_locked)
-                
-                # Disable new chapter if locked
-                self.new_chapter_action.setEnabled(not story.is_locked)
+        # Selection always rereads the story so title and lock state are current
+        self._invalidate_story(story_id)
+        story = self._get_story(story_id)
+        if story:
+            self.status_bar.showMessage(f"Editing: {story.title}")
+            
+            # Update publish action states
+            self.publish_story_action.setEnabled(not story.is_locked)
+            self.unpublish_story_action.setEnabled(story.is_locked)
+            
+            # Disable new chapter if locked
+            self.new_chapter_action.setEnabled(not story.is_locked)
     
     def load_chapters(self) -> None:
-        """Load chapters for current story and display as sticky notes."""
-        self.clear_canvas()
+        """Load chapters for current story in the background and display them."""
+        # Persist queued moves first so the reload reflects them
+        self._flush_positions()
         
+        self._chapter_load_token += 1
         if not self.current_story_id:
+            self.clear_canvas()
             return
         
-        with self.db_manager as conn:
-            chapters = Chapter.get_by_story(conn, self.current_story_id)
-            
-            for chapter in chapters:
+        story_id = self.current_story_id
+        worker = QueryWorker(
+            self.db_manager.db_path,
+            lambda conn: Chapter.get_summaries_by_story(conn, story_id)
+        )
+        worker.signals.finished.connect(
+            partial(self._on_chapters_loaded, self._chapter_load_token)
+        )
+        worker.signals.failed.connect(self._on_chapters_load_failed)
+        self._chapter_worker = worker
+        worker.start()
+    
+    def _on_chapters_loaded(self, token: int, chapters: list) -> None:
+        """Sync sticky notes with chapters fetched by the background worker.
+        
+        Existing notes are reused and refreshed; only on-screen chapters
+        without a note get a new widget, and other notes are removed.
+        """
+        if token != self._chapter_load_token:
+            return  # A newer load superseded this one
+        self._chapter_worker = None
+        self._chapter_counts[self.current_story_id] = len(chapters)
+        self._chapters = {chapter.id: chapter for chapter in chapters}
+        
+        for chapter in chapters:
+            note = self.sticky_notes.get(chapter.id)
+            if note is not None:
+                note.update_from_chapter(chapter)
+        
+        # Lay out the reused notes in one pass, then add and drop by visibility
+        self.canvas.update_sticky_note_positions()
+        self._refresh_visible_notes()
+    
+    def _refresh_visible_notes(self) -> None:
+        """Create notes for chapters near the viewport and remove the rest."""
+        visible = self.canvas.visible_canvas_rect(self._NOTE_CULL_MARGIN)
+        # Plain float bounds; this runs for every chapter on each pan and zoom
+        left, top, right, bottom = visible.left(), visible.top(), visible.right(), visible.bottom()
+        chapters = self._chapters
+        notes = self.sticky_notes
+        
+        for chapter_id in list(notes):
+            chapter = chapters.get(chapter_id)
+            if (chapter is None or not left <= chapter.board_x <= right
+                    or not top <= chapter.board_y <= bottom):
+                self._remove_sticky_note(notes.pop(chapter_id))
+        
+        for chapter in chapters.values():
+            if (chapter.id not in notes
+                    and left <= chapter.board_x <= right
+                    and top <= chapter.board_y <= bottom):
                 self.add_sticky_note(chapter)
     
+    def _on_chapters_load_failed(self, message: str) -> None:
+        """Report a failed background chapter load."""
+        self._chapter_worker = None
+        self.status_bar.showMessage(f"Failed to load chapters: {message}")
+    
     def clear_canvas(self) -> None:
         """Remove all sticky notes from canvas."""
-        for note in self.sticky_notes:
-            note.setParent(None)
-            note.deleteLater()
+        self._chapters.clear()
+        if not self.sticky_notes:
+            return
+        
+        # Repaint only where the notes were
+        region = QRegion()
+        for note in self.sticky_notes.values():
+            region += note.geometry()
+            self._remove_sticky_note(note)
         self.sticky_notes.clear()
-        self.canvas.update()
+        self.canvas.update(region)
+    
+    def _show_transient_status(self, message: str) -> None:
+        """Show a short-lived status bar message that doesn't interrupt the user."""
+        self.status_bar.showMessage(message, self._TRANSIENT_STATUS_MS)
+    
+    def _remove_sticky_note(self, note: StickyNote) -> None:
+        """Disconnect a sticky note's signals and schedule it for deletion."""
+        try:
+            note.double_clicked.disconnect(self.on_chapter_double_click)
+            note.position_changed.disconnect(self.on_chapter_moved)
+        except RuntimeError:
+            pass  # Already disconnected
+        self.canvas.unregister_note(note)
+        note.setParent(None)
+        note.deleteLater()
 
     def add_chapter(self) -> None:
         """Create a new chapter and add it to the canvas."""
@@ -421,29 +567,28 @@ class MainWindow(QMainWindow):
             return
         
         # Create new chapter in database
-        with self.db_manager as conn:
-            # Get count for default position
-            existing = Chapter.get_by_story(conn, self.current_story_id)
-            x_pos = 100 + (len(existing) * 180)  # Offset each new chapter
-            y_pos = 200
-            
-            chapter = Chapter.create(
-                conn,
-                story_id=self.current_story_id,
-                title=f"Chapter {len(existing) + 1}",
-                summary="Click to add summary...",
-                content=""
-            )
-            # Set initial position
-            chapter.board_x = x_pos
-            chapter.board_y = y_pos
-            chapter.update(conn)
-            
-            # Add sticky note to canvas
-            self.add_sticky_note(chapter)
-            
-            # Open editor immediately
-            self.open_chapter_editor(chapter)
+        # Get count for default position
+        count = self._chapter_count(self.current_story_id)
+        x_pos = 100 + (count * 180)  # Offset each new chapter
+        y_pos = 200
+        
+        chapter = Chapter.create(
+            self.conn,
+            story_id=self.current_story_id,
+            title=f"Chapter {count + 1}",
+            summary="Click to add summary...",
+            content="",
+            board_x=x_pos,
+            board_y=y_pos
+        )
+        self._chapter_counts[self.current_story_id] = count + 1
+        self._chapters[chapter.id] = chapter
+        
+        # Add sticky note to canvas
+        self.add_sticky_note(chapter)
+        
+        # Open editor immediately
+        self.open_chapter_editor(chapter)
         
         self.status_bar.showMessage("New chapter created")
     
@@ -454,22 +599,22 @@ class MainWindow(QMainWindow):
                               "Please select or create a story first.")
             return
         
-        with self.db_manager as conn:
-            existing = Chapter.get_by_story(conn, self.current_story_id)
-            
-            chapter = Chapter.create(
-                conn,
-                story_id=self.current_story_id,
-                title=f"Chapter {len(existing) + 1}",
-                summary="Click to add summary...",
-                content=""
-            )
-            chapter.board_x = x
-            chapter.board_y = y
-            chapter.update(conn)
-            
-            self.add_sticky_note(chapter)
-            self.open_chapter_editor(chapter)
+        count = self._chapter_count(self.current_story_id)
+        
+        chapter = Chapter.create(
+            self.conn,
+            story_id=self.current_story_id,
+            title=f"Chapter {count + 1}",
+            summary="Click to add summary...",
+            content="",
+            board_x=x,
+            board_y=y
+        )
+        self._chapter_counts[self.current_story_id] = count + 1
+        self._chapters[chapter.id] = chapter
+        
+        self.add_sticky_note(chapter)
+        self.open_chapter_editor(chapter)
         
         self.status_bar.showMessage("New chapter created")
     
@@ -477,30 +622,31 @@ class MainWindow(QMainWindow):
         """Add a sticky note widget for a chapter."""
         note = StickyNote(chapter, parent=self.canvas)
         
-        # Position using canvas coordinate transformation
-        screen_x, screen_y = self.canvas.canvas_to_screen(chapter.board_x, chapter.board_y)
-        note.move(int(screen_x), int(screen_y))
+        # The canvas positions the note now and on every pan/zoom
+        self.canvas.register_note(note)
         
-        note.double_clicked.connect(lambda: self.on_chapter_double_click(chapter.id))
-        note.position_changed.connect(self.on_chapter_moved)
+        note.double_clicked.connect(self.on_chapter_double_click, Qt.UniqueConnection)
+        note.position_changed.connect(self.on_chapter_moved, Qt.UniqueConnection)
         note.show()
-        self.sticky_notes.append(note)
+        self.sticky_notes[chapter.id] = note
     
     def on_chapter_double_click(self, chapter_id: int) -> None:
         """Open chapter editor when sticky note is double-clicked."""
+        # Make sure the editor loads the chapter's latest board position
+        self._flush_positions()
+        
         # Check if story is locked
-        with self.db_manager as conn:
-            chapter = Chapter.get_by_id(conn, chapter_id)
-            if chapter:
-                story = Story.get_by_id(conn, chapter.story_id)
-                if story and story.is_locked:
-                    QMessageBox.information(
-                        self,
-                        "Story Locked",
-                        f"'{story.title}' is final published and locked.\n\n"
-                        "Use File → Publish → Unpublish to unlock for editing."
-                    )
-                    return
+        chapter = Chapter.get_by_id(self.conn, chapter_id)
+        if chapter:
+            story = self._get_story(chapter.story_id)
+            if story and story.is_locked:
+                QMessageBox.information(
+                    self,
+                    "Story Locked",
+                    f"'{story.title}' is final published and locked.\n\n"
+                    "Use File → Publish → Unpublish to unlock for editing."
+                )
+                return
         
         # Check if already open
         if chapter_id in self.open_editors:
@@ -525,8 +671,8 @@ class MainWindow(QMainWindow):
         
         # Create new dockable editor
         editor = ChapterEditorDock(chapter, self)
-        editor.chapter_saved.connect(self.on_chapter_saved)
-        editor.chapter_closed.connect(self.on_editor_closed)
+        editor.chapter_saved.connect(self.on_chapter_saved, Qt.UniqueConnection)
+        editor.chapter_closed.connect(self.on_editor_closed, Qt.UniqueConnection)
         
         # Add to main window as dock widget
         self.addDockWidget(Qt.RightDockWidgetArea, editor)
@@ -540,29 +686,43 @@ class MainWindow(QMainWindow):
     
     def on_editor_closed(self, chapter_id: int) -> None:
         """Handle editor close - remove from tracking."""
-        if chapter_id in self.open_editors:
-            del self.open_editors[chapter_id]
+        editor = self.open_editors.pop(chapter_id, None)
+        if editor is not None:
+            try:
+                editor.chapter_saved.disconnect(self.on_chapter_saved)
+                editor.chapter_closed.disconnect(self.on_editor_closed)
+            except RuntimeError:
+                pass  # Already disconnected
     
     def on_chapter_saved(self, chapter: Chapter) -> None:
         """Handle chapter save - update sticky note display."""
         # Find and update the corresponding sticky note
-        for note in self.sticky_notes:
-            if note.chapter.id == chapter.id:
-                note.update_from_chapter(chapter)
-                # Reposition in case coordinates changed
-                screen_x, screen_y = self.canvas.canvas_to_screen(chapter.board_x, chapter.board_y)
-                note.move(int(screen_x), int(screen_y))
-                break
+        if chapter.id in self._chapters:
+            self._chapters[chapter.id] = chapter
+        note = self.sticky_notes.get(chapter.id)
+        if note is not None:
+            note.update_from_chapter(chapter)
+            # Reposition in case coordinates changed
+            screen_x, screen_y = self.canvas.canvas_to_screen(chapter.board_x, chapter.board_y)
+            note.move(int(screen_x), int(screen_y))
         self.status_bar.showMessage("Chapter saved")
     
     def on_chapter_moved(self, chapter_id: int, x: float, y: float) -> None:
-        """Save chapter position when sticky note is moved."""
-        with self.db_manager as conn:
-            chapter = Chapter.get_by_id(conn, chapter_id)
-            if chapter:
-                chapter.board_x = x
-                chapter.board_y = y
-                chapter.update(conn)
+        """Queue a chapter position save; moves are flushed shortly after the last one."""
+        chapter = self._chapters.get(chapter_id)
+        if chapter is not None:
+            chapter.board_x = x
+            chapter.board_y = y
+        self._pending_moves[chapter_id] = (x, y)
+        self._flush_timer.start()
+    
+    def _flush_positions(self) -> None:
+        """Write all queued chapter positions in a single transaction."""
+        self._flush_timer.stop()
+        if not self._pending_moves:
+            return
+        Chapter.update_positions(self.conn, self._pending_moves)
+        self._pending_moves.clear()
     
     def save_project(self) -> None:
         """Save current project state."""
@@ -576,8 +736,11 @@ class MainWindow(QMainWindow):
     
     def open_dictionary_editor(self) -> None:
         """Open the custom dictionary editor dialog."""
-        dialog = DictionaryEditorDialog(self)
-        dialog.exec()
+        if self._dictionary_dialog is None:
+            self._dictionary_dialog = DictionaryEditorDialog(self)
+        else:
+            self._dictionary_dialog.load_words()
+        self._dictionary_dialog.exec()
         # Rehighlight all open editors after dictionary changes
         for editor in self.open_editors.values():
             if hasattr(editor, 'editor') and hasattr(editor.editor, 'schedule_rehighlight'):
@@ -589,8 +752,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Story", "Please select a story first.")
             return
         
-        with self.db_manager as conn:
-            story = Story.get_by_id(conn, self.current_story_id)
+        story = self._get_story(self.current_story_id)
         
         if not story:
             return
@@ -598,6 +760,7 @@ class MainWindow(QMainWindow):
         dialog = PublishDialog(story, self)
         if dialog.exec():
             # Refresh story state
+            self._invalidate_story(story.id)
             self.on_story_selected(self.current_story_id)
             if self.story_manager:
                 self.story_manager.load_stories()
@@ -607,16 +770,15 @@ class MainWindow(QMainWindow):
         if not self.current_story_id:
             return
         
-        with self.db_manager as conn:
-            story = Story.get_by_id(conn, self.current_story_id)
+        story = self._get_story(self.current_story_id)
         
         if not story or not story.is_locked:
             return
         
         dialog = UnpublishDialog(story, self)
         if dialog.exec():
-            with self.db_manager as conn:
-                story.unpublish(conn)
+            story.unpublish(self.conn)
+            self._invalidate_story(story.id)
             
             # Refresh story state
             self.on_story_selected(self.current_story_id)
@@ -632,14 +794,16 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            with self.db_manager as conn:
-                project = Project.get_by_id(conn, self.current_project_id)
+            project = self._get_project(self.current_project_id)
             
             if not project:
                 return
             
-            dialog = ExportDialog(project, self)
-            dialog.exec()
+            if self._export_dialog is None:
+                self._export_dialog = ExportDialog(project, self)
+            else:
+                self._export_dialog.set_project(project)
+            self._export_dialog.exec()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Export failed:\n{str(e)}")
     
@@ -665,5 +829,11 @@ class MainWindow(QMainWindow):
         for editor in list(self.open_editors.values()):
             editor.close()
         
+        # Write any queued edits, then release the shared database connection
+        if self.story_manager:
+            self.story_manager.flush_pending_saves()
+        self._flush_positions()
+        self.conn.close()
+        
         # Accept the close event
         event.accept()
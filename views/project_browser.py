@@ -2,15 +2,55 @@
 Project browser dialog for BlueWriter.
 Allows creating and opening projects.
 """
+import sqlite3
+from typing import Any, List, Optional
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
-    QLabel, QLineEdit, QTextEdit, QPushButton, QListWidget,
-    QListWidgetItem, QMessageBox
+    QLabel, QLineEdit, QTextEdit, QPushButton, QListView, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QAbstractListModel, QModelIndex
 
 from models.project import Project
 from database.connection import DatabaseManager, get_default_db_path
+from views.db_worker import QueryWorker
+
+
+class ProjectListModel(QAbstractListModel):
+    """List model exposing projects by name, with descriptions as tooltips."""
+    
+    def __init__(self, projects: Optional[List[Project]] = None, parent=None) -> None:
+        """Initialize the model.
+        
+        Args:
+            projects: Projects to show initially.
+            parent: Parent object.
+        """
+        super().__init__(parent)
+        self._projects = list(projects or [])
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of projects (the list has no children)."""
+        return 0 if parent.isValid() else len(self._projects)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Return the project name, description or ID for a row."""
+        if not index.isValid():
+            return None
+        project = self._projects[index.row()]
+        if role == Qt.DisplayRole:
+            return project.name
+        if role == Qt.ToolTipRole:
+            return project.description or None
+        if role == Qt.UserRole:
+            return project.id
+        return None
+    
+    def set_projects(self, projects: List[Project]) -> None:
+        """Replace all projects in a single model reset."""
+        self.beginResetModel()
+        self._projects = list(projects)
+        self.endResetModel()
 
 
 class ProjectBrowserDialog(QDialog):
@@ -18,14 +58,27 @@ class ProjectBrowserDialog(QDialog):
     
     project_selected = Signal(int)  # Emits project ID when selected
     
-    def __init__(self, parent=None) -> None:
-        """Initialize the project browser dialog."""
+    def __init__(self, parent=None, db_manager: Optional[DatabaseManager] = None,
+                 conn: Optional[sqlite3.Connection] = None) -> None:
+        """Initialize the project browser dialog.
+        
+        Args:
+            parent: Parent widget.
+            db_manager: Database manager to use; defaults to the parent's, or
+                one for the default database.
+            conn: Open connection to reuse; a new one is opened per call if omitted.
+        """
         super().__init__(parent)
+        self.db_manager = (db_manager or getattr(parent, 'db_manager', None)
+                           or DatabaseManager(get_default_db_path()))
+        self.conn = conn
         self.setWindowTitle("Project Browser")
         self.setModal(True)
         self.resize(500, 400)
         
         self.selected_project_id = None
+        self._projects_worker = None
+        self._last_projects_hash = None
         self.setup_ui()
         self.refresh_project_list()
     
@@ -97,10 +150,13 @@ class ProjectBrowserDialog(QDialog):
         # Label
         layout.addWidget(QLabel("Select a project to open:"))
         
-        # Projects list (using QListWidget for simplicity)
-        self.projects_list = QListWidget()
-        self.projects_list.itemDoubleClicked.connect(self.on_project_double_clicked)
-        self.projects_list.itemSelectionChanged.connect(self.on_selection_changed)
+        # Projects list; the model holds the rows, so no per-item widgets
+        self.projects_model = ProjectListModel(parent=self)
+        self.projects_list = QListView()
+        self.projects_list.setModel(self.projects_model)
+        self.projects_list.setEditTriggers(QListView.NoEditTriggers)
+        self.projects_list.doubleClicked.connect(self.on_project_double_clicked)
+        self.projects_list.selectionModel().selectionChanged.connect(self.on_selection_changed)
         layout.addWidget(self.projects_list)
         
         # Open button
@@ -111,6 +167,12 @@ class ProjectBrowserDialog(QDialog):
         
         return widget
     
+    def _connection(self) -> sqlite3.Connection:
+        """Return the shared connection, or open one if none was supplied."""
+        if self.conn is not None:
+            return self.conn
+        return self.db_manager.connect()
+    
     def create_new_project(self) -> None:
         """Handle new project creation."""
         name = self.name_input.text().strip()
@@ -121,8 +183,7 @@ class ProjectBrowserDialog(QDialog):
             return
         
         try:
-            with DatabaseManager(get_default_db_path()) as db:
-                project = Project.create(db, name, description)
+            project = Project.create(self._connection(), name, description)
             
             QMessageBox.information(self, "Success", f"Project '{name}' created successfully!")
             
@@ -133,46 +194,63 @@ class ProjectBrowserDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to create project: {str(e)}")
 
-    def on_project_double_clicked(self, item: QListWidgetItem) -> None:
+    def on_project_double_clicked(self, index: QModelIndex) -> None:
         """Handle double-click on project - open it."""
-        project_id = item.data(Qt.UserRole)
+        project_id = index.data(Qt.UserRole)
         if project_id:
             self.project_selected.emit(project_id)
             self.accept()
     
     def on_selection_changed(self) -> None:
         """Enable/disable open button based on selection."""
-        has_selection = len(self.projects_list.selectedItems()) > 0
+        has_selection = self.projects_list.selectionModel().hasSelection()
         self.open_button.setEnabled(has_selection)
     
     def open_selected_project(self) -> None:
         """Handle opening selected project."""
-        selected_items = self.projects_list.selectedItems()
+        selected = self.projects_list.selectionModel().selectedIndexes()
         
-        if not selected_items:
+        if not selected:
             QMessageBox.warning(self, "No Selection", "Please select a project to open.")
             return
         
-        project_id = selected_items[0].data(Qt.UserRole)
+        project_id = selected[0].data(Qt.UserRole)
         if project_id:
             self.project_selected.emit(project_id)
             self.accept()
     
+    def reset(self) -> None:
+        """Clear the form and reload projects so a cached dialog can be reopened."""
+        self.name_input.clear()
+        self.desc_input.clear()
+        self.selected_project_id = None
+        self.tab_widget.setCurrentIndex(0)
+        self.refresh_project_list()
+    
     def refresh_project_list(self) -> None:
-        """Reload projects from database."""
-        self.projects_list.clear()
+        """Reload projects from the database in the background."""
+        worker = QueryWorker(self.db_manager.db_path, Project.get_all)
+        worker.signals.finished.connect(self._on_projects_loaded)
+        worker.signals.failed.connect(self._on_projects_load_failed)
+        self._projects_worker = worker
+        worker.start()
+    
+    def _on_projects_loaded(self, projects: list) -> None:
+        """Populate the project list with results from the background worker."""
+        self._projects_worker = None
         
-        try:
-            with DatabaseManager(get_default_db_path()) as db:
-                projects = Project.get_all(db)
-            
-            for project in projects:
-                item = QListWidgetItem(project.name)
-                item.setData(Qt.UserRole, project.id)
-                # Add tooltip with description
-                if project.description:
-                    item.setToolTip(project.description)
-                self.projects_list.addItem(item)
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load projects: {str(e)}")
+        # Skip the rebuild when nothing shown has changed
+        projects_hash = hash(tuple((p.id, p.name, p.description) for p in projects))
+        if projects_hash == self._last_projects_hash:
+            return
+        self._last_projects_hash = projects_hash
+        
+        self.projects_model.set_projects(projects)
+        
+        # A model reset clears the selection without signalling; sync the button
+        self.on_selection_changed()
+    
+    def _on_projects_load_failed(self, message: str) -> None:
+        """Report a failed background project load."""
+        self._projects_worker = None
+        QMessageBox.critical(self, "Error", f"Failed to load projects: {message}")
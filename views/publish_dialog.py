@@ -2,7 +2,9 @@
 Publishing dialog for BlueWriter.
 Handles rough draft and final draft publishing to PDF, DOCX, and EPUB.
 """
+from functools import partial
 from pathlib import Path
+from typing import Dict, Tuple
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -10,11 +12,27 @@ from PySide6.QtWidgets import (
     QProgressDialog, QCheckBox, QComboBox, QLineEdit,
     QButtonGroup
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from models.story import Story, STATUS_DRAFT, STATUS_ROUGH_PUBLISHED, STATUS_FINAL_PUBLISHED
-from utils.publishing import StoryPublisher, get_story_stats
-from database.connection import get_default_db_path
+from utils.publishing import get_publisher, get_story_stats
+from views.db_worker import TaskWorker
+from database.connection import DatabaseManager, get_default_db_path
+
+
+# Shown under the format picker
+_FORMAT_DESCRIPTIONS: Dict[str, str] = {
+    'pdf': "PDF is ideal for sharing and printing. Preserves exact formatting across all devices.",
+    'docx': "DOCX (Word) is the industry standard for editors. Allows track changes and comments for professional editing workflow.",
+    'epub': "EPUB is the standard ebook format. Compatible with Amazon KDP, Apple Books, Kobo, and most e-readers."
+}
+
+# Save dialog filter and file extension per format
+_FORMAT_EXTENSIONS: Dict[str, Tuple[str, str]] = {
+    'pdf': ("PDF Files (*.pdf)", ".pdf"),
+    'docx': ("Word Documents (*.docx)", ".docx"),
+    'epub': ("EPUB Files (*.epub)", ".epub")
+}
 
 
 class PublishDialog(QDialog):
@@ -25,6 +43,11 @@ class PublishDialog(QDialog):
         self.story = story
         self.db_path = str(get_default_db_path())
         
+        # Built on demand: author fields on first EPUB selection, stats on first show
+        self.author_group = None
+        self._initialized = False
+        self._worker = None
+        
         self.setWindowTitle(f"Publish: {story.title}")
         self.setMinimumWidth(500)
         
@@ -42,12 +65,8 @@ class PublishDialog(QDialog):
         self.title_label = QLabel(f"<b>{self.story.title}</b>")
         info_layout.addWidget(self.title_label)
         
-        # Get stats
-        stats = get_story_stats(self.db_path, self.story.id)
-        stats_text = (f"Chapters: {stats['chapter_count']} | "
-                     f"Words: {stats['total_words']:,} | "
-                     f"Avg per chapter: {stats['avg_chapter_words']:,}")
-        self.stats_label = QLabel(stats_text)
+        # Stats are filled in once the dialog is on screen
+        self.stats_label = QLabel("Loading stats…")
         info_layout.addWidget(self.stats_label)
         
         self.status_label = QLabel()
@@ -56,8 +75,8 @@ class PublishDialog(QDialog):
         layout.addWidget(info_group)
         
         # Format selection
-        format_group = QGroupBox("Output Format")
-        format_layout = QVBoxLayout(format_group)
+        self.format_group = QGroupBox("Output Format")
+        format_layout = QVBoxLayout(self.format_group)
         
         self.format_combo = QComboBox()
         self.format_combo.addItem("PDF - Portable Document Format", "pdf")
@@ -72,17 +91,7 @@ class PublishDialog(QDialog):
         self.format_desc.setStyleSheet("color: gray; padding: 5px;")
         format_layout.addWidget(self.format_desc)
         
-        layout.addWidget(format_group)
-        
-        # Author name (for EPUB)
-        self.author_group = QGroupBox("Author Information")
-        author_layout = QHBoxLayout(self.author_group)
-        author_layout.addWidget(QLabel("Author Name:"))
-        self.author_edit = QLineEdit()
-        self.author_edit.setPlaceholderText("Enter author name for ebook metadata")
-        author_layout.addWidget(self.author_edit)
-        self.author_group.hide()  # Only show for EPUB
-        layout.addWidget(self.author_group)
+        layout.addWidget(self.format_group)
         
         # Publishing type options
         type_group = QGroupBox("Publishing Type")
@@ -146,16 +155,41 @@ class PublishDialog(QDialog):
         """Update UI based on selected format."""
         format_type = self.format_combo.currentData()
         
-        descriptions = {
-            'pdf': "PDF is ideal for sharing and printing. Preserves exact formatting across all devices.",
-            'docx': "DOCX (Word) is the industry standard for editors. Allows track changes and comments for professional editing workflow.",
-            'epub': "EPUB is the standard ebook format. Compatible with Amazon KDP, Apple Books, Kobo, and most e-readers."
-        }
-        
-        self.format_desc.setText(descriptions.get(format_type, ""))
+        self.format_desc.setText(_FORMAT_DESCRIPTIONS.get(format_type, ""))
         
         # Show author field only for EPUB
-        self.author_group.setVisible(format_type == 'epub')
+        if format_type == 'epub' and self.author_group is None:
+            self._create_author_group()
+        if self.author_group is not None:
+            self.author_group.setVisible(format_type == 'epub')
+    
+    def _create_author_group(self) -> None:
+        """Build the author name fields below the format selection."""
+        self.author_group = QGroupBox("Author Information")
+        author_layout = QHBoxLayout(self.author_group)
+        author_layout.addWidget(QLabel("Author Name:"))
+        self.author_edit = QLineEdit()
+        self.author_edit.setPlaceholderText("Enter author name for ebook metadata")
+        author_layout.addWidget(self.author_edit)
+        
+        layout = self.layout()
+        layout.insertWidget(layout.indexOf(self.format_group) + 1, self.author_group)
+    
+    def showEvent(self, event) -> None:
+        """Schedule the stats query the first time the dialog is shown."""
+        super().showEvent(event)
+        if not self._initialized:
+            self._initialized = True
+            QTimer.singleShot(0, self._populate_stats)
+    
+    def _populate_stats(self) -> None:
+        """Fill in the story statistics label."""
+        stats = get_story_stats(self.db_path, self.story.id)
+        self.stats_label.setText(
+            f"Chapters: {stats['chapter_count']} | "
+            f"Words: {stats['total_words']:,} | "
+            f"Avg per chapter: {stats['avg_chapter_words']:,}"
+        )
     
     def update_status_display(self) -> None:
         """Update the status label based on story status."""
@@ -204,12 +238,7 @@ class PublishDialog(QDialog):
                 return
         
         # Get file extension and filter
-        extensions = {
-            'pdf': ("PDF Files (*.pdf)", ".pdf"),
-            'docx': ("Word Documents (*.docx)", ".docx"),
-            'epub': ("EPUB Files (*.epub)", ".epub")
-        }
-        file_filter, ext = extensions[format_type]
+        file_filter, ext = _FORMAT_EXTENSIONS[format_type]
         
         # Get save location
         default_name = f"{self.story.title}_{'FINAL' if is_final else 'DRAFT'}{ext}"
@@ -224,62 +253,63 @@ class PublishDialog(QDialog):
             return
         
         # Show progress
-        progress = QProgressDialog("Publishing...", None, 0, 0, self)
-        progress.setWindowModality(Qt.WindowModal)
-        progress.show()
+        self._progress = QProgressDialog("Publishing...", None, 0, 0, self)
+        self._progress.setWindowModality(Qt.WindowModal)
+        self._progress.show()
+        self.publish_btn.setEnabled(False)
         
         try:
-            publisher = StoryPublisher(self.db_path)
-            include_synopsis = self.include_synopsis.isChecked()
-            
-            # Update story status
-            if is_final:
-                from database.connection import DatabaseManager
-                with DatabaseManager(self.db_path) as conn:
-                    story = Story.get_by_id(conn, self.story.id)
-                    story.publish_final(conn)
-            else:
-                from database.connection import DatabaseManager
-                with DatabaseManager(self.db_path) as conn:
-                    story = Story.get_by_id(conn, self.story.id)
-                    story.publish_rough(conn)
-            
-            # Generate output based on format
-            if format_type == 'pdf':
-                publisher.publish_to_pdf(
-                    self.story.id,
-                    file_path,
-                    include_synopsis=include_synopsis,
-                    draft_watermark=not is_final
-                )
-            elif format_type == 'docx':
-                publisher.publish_to_docx(
-                    self.story.id,
-                    file_path,
-                    include_synopsis=include_synopsis,
-                    draft_watermark=not is_final
-                )
-            elif format_type == 'epub':
-                publisher.publish_to_epub(
-                    self.story.id,
-                    file_path,
-                    author=self.author_edit.text().strip(),
-                    include_synopsis=include_synopsis
-                )
-            
-            progress.close()
-            
-            QMessageBox.information(
-                self,
-                "Published",
-                f"Successfully published to:\n{file_path}"
-            )
-            
-            self.accept()
-            
+            # Update story status here so database writes stay on the GUI thread
+            # publish_* only writes the status columns, so the loaded story will do
+            with DatabaseManager(self.db_path) as conn:
+                if is_final:
+                    self.story.publish_final(conn)
+                else:
+                    self.story.publish_rough(conn)
         except Exception as e:
-            progress.close()
-            QMessageBox.critical(self, "Error", f"Publishing failed:\n{str(e)}")
+            self._on_publish_failed(str(e))
+            return
+        
+        # Generate output in the background so the UI keeps painting
+        publisher = get_publisher(self.db_path)
+        include_synopsis = self.include_synopsis.isChecked()
+        if format_type == 'pdf':
+            task = partial(publisher.publish_to_pdf, self.story.id, file_path,
+                           include_synopsis=include_synopsis,
+                           draft_watermark=not is_final)
+        elif format_type == 'docx':
+            task = partial(publisher.publish_to_docx, self.story.id, file_path,
+                           include_synopsis=include_synopsis,
+                           draft_watermark=not is_final)
+        else:
+            task = partial(publisher.publish_to_epub, self.story.id, file_path,
+                           author=self.author_edit.text().strip(),
+                           include_synopsis=include_synopsis)
+        
+        self._worker = TaskWorker(task)
+        self._worker.signals.finished.connect(self._on_publish_finished)
+        self._worker.signals.failed.connect(self._on_publish_failed)
+        self._worker.start()
+    
+    def _on_publish_finished(self, output_path: str) -> None:
+        """Handle a completed publish."""
+        self._worker = None
+        self._progress.close()
+        
+        QMessageBox.information(
+            self,
+            "Published",
+            f"Successfully published to:\n{output_path}"
+        )
+        
+        self.accept()
+    
+    def _on_publish_failed(self, message: str) -> None:
+        """Handle a failed publish."""
+        self._worker = None
+        self._progress.close()
+        self.publish_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Publishing failed:\n{message}")
 
 
 class UnpublishDialog(QDialog):
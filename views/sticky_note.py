@@ -3,8 +3,8 @@ Sticky note widget for BlueWriter timeline.
 Displays chapter information as draggable notes.
 """
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QPainter, QBrush, QColor, QPen, QFont
-from PySide6.QtCore import Qt, QRectF, QPoint, Signal
+from PySide6.QtGui import QPainter, QBrush, QColor, QPen, QFont, QPixmap
+from PySide6.QtCore import Qt, QLineF, QRectF, QPoint, Signal, QTimer
 
 from models.chapter import Chapter
 
@@ -16,6 +16,23 @@ class StickyNote(QWidget):
     double_clicked = Signal(int)  # Emits chapter ID
     position_changed = Signal(int, float, float)  # chapter_id, canvas_x, canvas_y
     
+    # Notes have a fixed size, so their paint rectangles are constant
+    WIDTH = 160
+    HEIGHT = 100
+    _SHADOW_RECT = QRectF(4, 4, WIDTH - 4, HEIGHT - 4)
+    _NOTE_RECT = QRectF(0, 0, WIDTH - 4, HEIGHT - 4)
+    _TITLE_RECT = QRectF(8, 8, WIDTH - 20, 22)
+    _SUMMARY_RECT = QRectF(8, 36, WIDTH - 20, HEIGHT - 44)
+    _SEPARATOR_LINE = QLineF(8, 32, WIDTH - 12, 32)
+    
+    # Drag moves are applied at most once per frame (~60 Hz)
+    DRAG_FRAME_MS = 16
+    
+    # Paint objects shared by all notes; built on first paint since fonts
+    # need a running application
+    _shared_style = None  # (shadow brush, title pen, summary pen, title font, summary font)
+    _color_styles = {}  # {color: (fill brush, border pen, separator pen)}
+    
     def __init__(self, chapter: Chapter, parent=None) -> None:
         """Initialize the sticky note from a chapter."""
         super().__init__(parent)
@@ -23,16 +40,23 @@ class StickyNote(QWidget):
         self.chapter = chapter
         self.is_dragging = False
         self.drag_start_pos = QPoint()
+        self._pending_pos = None  # Latest drag position not yet applied
+        self._move_scheduled = False
+        self._cached_pixmap = None  # Rendered note, rebuilt when its content changes
+        self._cached_key = None  # (title, summary, color) the pixmap was rendered from
         
         # Canvas coordinates (world position)
         self.canvas_x = chapter.board_x
         self.canvas_y = chapter.board_y
+        self._update_display_text()
         
-        # Set size
-        self.setFixedSize(160, 100)
+        # Set size. The note is deliberately not WA_OpaquePaintEvent: its
+        # rounded corners and translucent shadow let the canvas show through,
+        # so Qt must paint the canvas underneath first.
+        self.setFixedSize(self.WIDTH, self.HEIGHT)
         
-        # Enable mouse tracking
-        self.setMouseTracking(True)
+        # No mouse tracking: moves only matter while dragging, when Qt
+        # delivers them anyway; the cursor shape needs no tracking
         self.setCursor(Qt.OpenHandCursor)
     
     def update_from_chapter(self, chapter: Chapter) -> None:
@@ -42,6 +66,14 @@ class StickyNote(QWidget):
         self.canvas_y = chapter.board_y
         self.update()
     
+    def _update_display_text(self) -> None:
+        """Compute the title and truncated summary shown on the note."""
+        self._display_title = self.chapter.title if self.chapter.title else "Untitled"
+        summary = self.chapter.summary if self.chapter.summary else "No summary"
+        if len(summary) > 80:
+            summary = summary[:77] + "..."
+        self._display_summary = summary
+    
     def set_canvas_position(self, x: float, y: float) -> None:
         """Set position in canvas coordinates."""
         self.canvas_x = x
@@ -51,52 +83,88 @@ class StickyNote(QWidget):
         """Get position in canvas coordinates."""
         return (self.canvas_x, self.canvas_y)
 
+    @classmethod
+    def _style_for(cls, color_name: str) -> tuple:
+        """Return the shared paint objects plus those for a note color."""
+        if cls._shared_style is None:
+            title_font = QFont()
+            title_font.setPointSize(10)
+            title_font.setBold(True)
+            summary_font = QFont()
+            summary_font.setPointSize(8)
+            cls._shared_style = (
+                QBrush(QColor(0, 0, 0, 40)),
+                QPen(QColor(0, 0, 0)),
+                QPen(QColor(60, 60, 60)),
+                title_font,
+                summary_font,
+            )
+        
+        color_style = cls._color_styles.get(color_name)
+        if color_style is None:
+            color = QColor(color_name)
+            color_style = (
+                QBrush(color),
+                QPen(color.darker(120), 1),
+                QPen(color.darker(115), 1),
+            )
+            cls._color_styles[color_name] = color_style
+        return cls._shared_style + color_style
+    
     def paintEvent(self, event) -> None:
-        """Paint the sticky note."""
+        """Paint the sticky note from its cached rendering."""
+        # The chapter may be edited in place, so compare against its current values
+        chapter = self.chapter
+        key = (chapter.title, chapter.summary, chapter.color)
+        ratio = self.devicePixelRatioF()
+        if (self._cached_pixmap is None or key != self._cached_key
+                or self._cached_pixmap.devicePixelRatio() != ratio):
+            self._update_display_text()
+            self._cached_pixmap = self._render_pixmap(ratio)
+            self._cached_key = key
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cached_pixmap)
+    
+    def _render_pixmap(self, ratio: float) -> QPixmap:
+        """Render the note into a transparent pixmap at the given pixel ratio."""
+        pixmap = QPixmap(round(self.WIDTH * ratio), round(self.HEIGHT * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Get note color (default yellow if not set)
-        color = QColor(self.chapter.color if self.chapter.color else "#FFFF88")
+        (shadow_brush, title_pen, summary_pen, title_font, summary_font,
+         fill_brush, border_pen, separator_pen) = self._style_for(self.chapter.color or "#FFFF88")
         
         # Draw shadow
-        shadow_rect = QRectF(4, 4, self.width() - 4, self.height() - 4)
-        painter.setBrush(QBrush(QColor(0, 0, 0, 40)))
+        painter.setBrush(shadow_brush)
         painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(shadow_rect, 5, 5)
+        painter.drawRoundedRect(self._SHADOW_RECT, 5, 5)
 
         # Draw main note background
-        note_rect = QRectF(0, 0, self.width() - 4, self.height() - 4)
-        painter.setBrush(QBrush(color))
-        painter.setPen(QPen(color.darker(120), 1))
-        painter.drawRoundedRect(note_rect, 5, 5)
+        painter.setBrush(fill_brush)
+        painter.setPen(border_pen)
+        painter.drawRoundedRect(self._NOTE_RECT, 5, 5)
         
         # Draw title
-        painter.setPen(QPen(QColor(0, 0, 0)))
-        title_font = QFont()
-        title_font.setPointSize(10)
-        title_font.setBold(True)
+        painter.setPen(title_pen)
         painter.setFont(title_font)
         
-        title_rect = QRectF(8, 8, self.width() - 20, 22)
-        title = self.chapter.title if self.chapter.title else "Untitled"
-        painter.drawText(title_rect, Qt.AlignLeft | Qt.TextSingleLine, title)
+        painter.drawText(self._TITLE_RECT, Qt.AlignLeft | Qt.TextSingleLine, self._display_title)
         
         # Draw separator line
-        painter.setPen(QPen(color.darker(115), 1))
-        painter.drawLine(8, 32, self.width() - 12, 32)
+        painter.setPen(separator_pen)
+        painter.drawLine(self._SEPARATOR_LINE)
         
         # Draw summary
-        painter.setPen(QPen(QColor(60, 60, 60)))
-        summary_font = QFont()
-        summary_font.setPointSize(8)
+        painter.setPen(summary_pen)
         painter.setFont(summary_font)
         
-        summary_rect = QRectF(8, 36, self.width() - 20, self.height() - 44)
-        summary = self.chapter.summary if self.chapter.summary else "No summary"
-        if len(summary) > 80:
-            summary = summary[:77] + "..."
-        painter.drawText(summary_rect, Qt.AlignLeft | Qt.TextWordWrap, summary)
+        painter.drawText(self._SUMMARY_RECT, Qt.AlignLeft | Qt.TextWordWrap, self._display_summary)
+        painter.end()
+        return pixmap
     
     def mousePressEvent(self, event) -> None:
         """Handle mouse press for dragging."""
@@ -108,25 +176,38 @@ class StickyNote(QWidget):
             event.accept()
     
     def mouseMoveEvent(self, event) -> None:
-        """Handle drag movement."""
+        """Handle drag movement; moves are coalesced to one per frame."""
         if self.is_dragging:
-            # Calculate new screen position
-            new_screen_pos = self.mapToParent(event.pos() - self.drag_start_pos)
-            self.move(new_screen_pos)
-            
-            # Update canvas coordinates via parent
-            parent = self.parent()
-            if parent and hasattr(parent, 'screen_to_canvas'):
-                cx, cy = parent.screen_to_canvas(new_screen_pos.x(), new_screen_pos.y())
-                self.canvas_x = cx
-                self.canvas_y = cy
+            # Map now, while the note is still where the event was delivered
+            self._pending_pos = self.mapToParent(event.pos() - self.drag_start_pos)
+            if not self._move_scheduled:
+                self._move_scheduled = True
+                QTimer.singleShot(self.DRAG_FRAME_MS, self._apply_pending_move)
             event.accept()
     
+    def _apply_pending_move(self) -> None:
+        """Move to the latest drag position and update canvas coordinates."""
+        self._move_scheduled = False
+        new_screen_pos = self._pending_pos
+        if new_screen_pos is None:
+            return
+        self._pending_pos = None
+        self.move(new_screen_pos)
+        
+        # Update canvas coordinates via parent
+        parent = self.parent()
+        if parent and hasattr(parent, 'screen_to_canvas'):
+            cx, cy = parent.screen_to_canvas(new_screen_pos.x(), new_screen_pos.y())
+            self.canvas_x = cx
+            self.canvas_y = cy
+    
     def mouseReleaseEvent(self, event) -> None:
         """Handle mouse release - emit position change with canvas coordinates."""
         if event.button() == Qt.LeftButton and self.is_dragging:
             self.is_dragging = False
             self.setCursor(Qt.OpenHandCursor)
+            # Land on the final position before reporting it
+            self._apply_pending_move()
             # Emit canvas coordinates
             self.position_changed.emit(self.chapter.id, self.canvas_x, self.canvas_y)
             event.accept()
@@ -7,6 +7,10 @@ from PySide6.QtWidgets import (
     QLabel, QLineEdit, QTextEdit, QPushButton,
     QMessageBox
 )
+import sqlite3
+from functools import partial
+from typing import Optional
+
 from PySide6.QtCore import Qt, Signal, QTimer
 
 from models.story import Story
@@ -18,12 +22,32 @@ class StoryManagerWidget(QWidget):
     
     story_selected = Signal(int)  # Emits story ID when selected
     story_added = Signal(int)     # Emits story ID when added
+    story_changed = Signal(int)   # Emits story ID after its title or synopsis is saved
+    status_message = Signal(str)  # Short feedback for the window's status bar
+    
+    # Idle time after the last keystroke before a synopsis is saved
+    SYNOPSIS_SAVE_DELAY_MS = 1000
     
-    def __init__(self, project_id: int, parent=None) -> None:
+    def __init__(self, project_id: int, parent=None,
+                 conn: Optional[sqlite3.Connection] = None) -> None:
+        """Initialize the story manager.
+        
+        Args:
+            project_id: ID of the project whose stories are shown.
+            parent: Parent widget.
+            conn: Open connection to reuse; if omitted, one is opened for
+                the widget's lifetime and closed when it is destroyed.
+        """
         super().__init__(parent)
         self.project_id = project_id
+        if conn is None:
+            conn = DatabaseManager(get_default_db_path()).connect()
+            self.destroyed.connect(conn.close)
+        self.conn = conn
         self.current_story_id = None
         self.synopsis_edits = {}  # Track QTextEdit widgets by story_id
+        self._save_timers = {}  # Pending synopsis auto-saves by story_id
+        self._unbuilt_tabs = {}  # Stories whose tab body is built on first show
         
         self.setup_ui()
         self.load_stories()
@@ -50,33 +74,96 @@ class StoryManagerWidget(QWidget):
         layout.addWidget(self.placeholder)
 
     def load_stories(self) -> None:
-        """Load all stories for the current project."""
+        """Load all stories for the current project.
+        
+        Existing tabs are kept and updated in place; only tabs for added or
+        removed stories are created or torn down.
+        """
         try:
-            with DatabaseManager(get_default_db_path()) as db:
-                stories = Story.get_by_project(db, self.project_id)
+            stories = Story.get_summaries_by_project(self.conn, self.project_id)
             
-            # Clear existing tabs
-            self.tab_widget.blockSignals(True)  # Prevent signals while rebuilding
-            while self.tab_widget.count() > 0:
-                self.tab_widget.removeTab(0)
-            self.synopsis_edits.clear()
-            self.tab_widget.blockSignals(False)
+            # Save pending edits before editors are updated or go away
+            self.flush_pending_saves()
+            
+            self.tab_widget.blockSignals(True)  # Prevent signals while syncing
+            wanted = {story.id for story in stories}
+            for index in reversed(range(self.tab_widget.count())):
+                if self.tab_widget.widget(index).property("story_id") not in wanted:
+                    self._remove_tab(index)
             
-            # Add tabs for each story
-            for story in stories:
-                self.add_story_tab(story)
+            existing = {self.tab_widget.widget(i).property("story_id"): self.tab_widget.widget(i)
+                        for i in range(self.tab_widget.count())}
+            for position, story in enumerate(stories):
+                tab = existing.get(story.id)
+                if tab is None:
+                    self.add_story_tab(story, position)
+                    continue
+                index = self.tab_widget.indexOf(tab)
+                if index != position:
+                    self.tab_widget.tabBar().moveTab(index, position)
+                self._refresh_tab(position, story)
+            self.tab_widget.blockSignals(False)
             
             # Update placeholder visibility
             if self.tab_widget.count() > 0:
                 self.placeholder.hide()
-                # Auto-select first story after a brief delay to ensure UI is ready
-                QTimer.singleShot(100, self.select_first_story)
+                current = self.tab_widget.currentWidget()
+                if self.current_story_id in wanted and current.property("story_id") == self.current_story_id:
+                    # Keep the current story selected; rebuild its editors if replaced
+                    story = self._unbuilt_tabs.pop(self.current_story_id, None)
+                    if story is not None:
+                        self._build_tab_body(current, story)
+                else:
+                    # Auto-select the first story on the next event-loop pass, once the
+                    # owner has connected story_selected
+                    QTimer.singleShot(0, self.select_first_story)
             else:
                 self.placeholder.show()
                 
         except Exception as e:
+            self.tab_widget.blockSignals(False)
             QMessageBox.critical(self, "Error", f"Failed to load stories: {str(e)}")
     
+    def _refresh_tab(self, index: int, story: Story) -> None:
+        """Bring an existing story tab up to date with the stored story."""
+        tab = self.tab_widget.widget(index)
+        self.tab_widget.setTabText(index, self._tab_title(story))
+        
+        # A status change alters the banner and lock state, so start the body afresh
+        if tab.property("story_status") != story.status:
+            was_current = index == self.tab_widget.currentIndex()
+            self._remove_tab(index)
+            self.add_story_tab(story, index)
+            if was_current:
+                self.tab_widget.setCurrentIndex(index)
+            return
+        
+        if story.id in self._unbuilt_tabs:
+            self._unbuilt_tabs[story.id] = story
+            return
+        
+        title_edit = tab.findChild(QLineEdit)
+        if title_edit.text() != story.title and not title_edit.hasFocus():
+            title_edit.setText(story.title)
+        synopsis_edit = self.synopsis_edits[story.id]
+        if synopsis_edit.toPlainText() != (story.synopsis or ""):
+            synopsis_edit.blockSignals(True)  # Not a user edit; don't schedule a save
+            synopsis_edit.setPlainText(story.synopsis or "")
+            synopsis_edit.blockSignals(False)
+    
+    def _remove_tab(self, index: int) -> None:
+        """Remove a story tab and drop everything tracked for it."""
+        tab = self.tab_widget.widget(index)
+        story_id = tab.property("story_id")
+        self.tab_widget.removeTab(index)
+        tab.deleteLater()
+        self.synopsis_edits.pop(story_id, None)
+        self._unbuilt_tabs.pop(story_id, None)
+        timer = self._save_timers.pop(story_id, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+    
     def select_first_story(self) -> None:
         """Select the first story tab and emit signal."""
         if self.tab_widget.count() > 0:
@@ -84,14 +171,32 @@ class StoryManagerWidget(QWidget):
             # Manually trigger since we blocked signals during load
             self.on_tab_changed(0)
     
-    def add_story_tab(self, story: Story) -> None:
-        """Add a tab for a story."""
+    def add_story_tab(self, story: Story, index: int = -1) -> None:
+        """Add a tab for a story; its editors are built when first shown.
+        
+        Args:
+            story: Story to show.
+            index: Tab position; appended at the end if -1.
+        """
         tab = QWidget()
+        tab.setProperty("story_id", story.id)
+        tab.setProperty("story_status", story.status)
+        self._unbuilt_tabs[story.id] = story
+        self.tab_widget.insertTab(index, tab, self._tab_title(story))
+    
+    @staticmethod
+    def _tab_title(story: Story) -> str:
+        """Return the tab label, with a lock icon if the story is locked."""
+        return f"🔒 {story.title}" if story.is_locked else story.title
+    
+    def _build_tab_body(self, tab: QWidget, story: Story) -> None:
+        """Build the status, title and synopsis editors for a story tab."""
         layout = QVBoxLayout(tab)
         layout.setContentsMargins(5, 5, 5, 5)
+        locked = story.is_locked
         
         # Status indicator for locked stories
-        if story.is_locked:
+        if locked:
             status_label = QLabel("🔒 <b>Final Published</b> - Story is locked from editing")
             status_label.setStyleSheet("color: green; padding: 5px; background: #1a3a1a; border-radius: 3px;")
             layout.addWidget(status_label)
@@ -105,8 +210,8 @@ class StoryManagerWidget(QWidget):
         title_layout.addWidget(QLabel("Title:"))
         title_edit = QLineEdit(story.title)
         title_edit.setProperty("story_id", story.id)
-        title_edit.setEnabled(not story.is_locked)
-        title_edit.editingFinished.connect(lambda: self.save_story_title(story.id, title_edit))
+        title_edit.setEnabled(not locked)
+        title_edit.editingFinished.connect(partial(self.save_story_title, story.id, title_edit))
         title_layout.addWidget(title_edit)
         layout.addLayout(title_layout)
         
@@ -116,8 +221,8 @@ class StoryManagerWidget(QWidget):
         synopsis_edit.setPlainText(story.synopsis or "")
         synopsis_edit.setMaximumHeight(120)
         synopsis_edit.setPlaceholderText("Enter story synopsis...")
-        synopsis_edit.setEnabled(not story.is_locked)
-        synopsis_edit.textChanged.connect(lambda: self.on_synopsis_changed(story.id))
+        synopsis_edit.setEnabled(not locked)
+        synopsis_edit.textChanged.connect(partial(self.on_synopsis_changed, story.id))
         layout.addWidget(synopsis_edit)
         
         # Store reference for saving
@@ -125,17 +230,12 @@ class StoryManagerWidget(QWidget):
         
         # Save button for synopsis (hidden if locked)
         save_btn = QPushButton("Save Synopsis")
-        save_btn.clicked.connect(lambda: self.save_synopsis(story.id))
-        save_btn.setEnabled(not story.is_locked)
+        save_btn.clicked.connect(partial(self.save_synopsis, story.id))
+        save_btn.setEnabled(not locked)
         layout.addWidget(save_btn)
         
         layout.addStretch()
-        
-        # Add tab with lock icon in title if locked
-        tab_title = f"🔒 {story.title}" if story.is_locked else story.title
-        tab_index = self.tab_widget.addTab(tab, tab_title)
-        tab.setProperty("story_id", story.id)
-
+    
     def on_tab_changed(self, index: int) -> None:
         """Handle tab selection - emit story_selected signal."""
         if index >= 0:
@@ -143,30 +243,48 @@ class StoryManagerWidget(QWidget):
             if tab:
                 story_id = tab.property("story_id")
                 if story_id is not None:
+                    story = self._unbuilt_tabs.pop(story_id, None)
+                    if story is not None:
+                        self._build_tab_body(tab, story)
                     self.current_story_id = story_id
                     self.story_selected.emit(story_id)
                     self.placeholder.hide()
     
     def on_synopsis_changed(self, story_id: int) -> None:
-        """Mark synopsis as modified (visual feedback could be added here)."""
-        # Could add a "modified" indicator to the tab
-        pass
+        """Schedule a synopsis save once typing pauses."""
+        timer = self._save_timers.get(story_id)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(self.SYNOPSIS_SAVE_DELAY_MS)
+            timer.timeout.connect(partial(self.save_synopsis, story_id))
+            self._save_timers[story_id] = timer
+        timer.start()
+    
+    def flush_pending_saves(self) -> None:
+        """Immediately save every synopsis with a pending auto-save."""
+        for story_id, timer in list(self._save_timers.items()):
+            if timer.isActive():
+                self.save_synopsis(story_id)
     
     def save_synopsis(self, story_id: int) -> None:
         """Save the synopsis for a story."""
+        timer = self._save_timers.get(story_id)
+        if timer is not None:
+            timer.stop()
         if story_id not in self.synopsis_edits:
             return
         
         synopsis_text = self.synopsis_edits[story_id].toPlainText()
         
         try:
-            with DatabaseManager(get_default_db_path()) as db:
-                story = Story.get_by_id(db, story_id)
-                if story:
-                    story.synopsis = synopsis_text
-                    story.update(db)
+            story = Story.get_by_id(self.conn, story_id)
+            if story:
+                story.synopsis = synopsis_text
+                story.update(self.conn)
+                self.story_changed.emit(story_id)
             
-            QMessageBox.information(self, "Saved", "Synopsis saved successfully!")
+            self.status_message.emit("Synopsis saved")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save synopsis: {str(e)}")
     
@@ -177,11 +295,11 @@ class StoryManagerWidget(QWidget):
             return
         
         try:
-            with DatabaseManager(get_default_db_path()) as db:
-                story = Story.get_by_id(db, story_id)
-                if story:
-                    story.title = new_title
-                    story.update(db)
+            story = Story.get_by_id(self.conn, story_id)
+            if story:
+                story.title = new_title
+                story.update(self.conn)
+                self.story_changed.emit(story_id)
             
             # Update tab title
             for i in range(self.tab_widget.count()):
@@ -196,8 +314,7 @@ class StoryManagerWidget(QWidget):
     def create_new_story(self) -> None:
         """Create a new story."""
         try:
-            with DatabaseManager(get_default_db_path()) as db:
-                story = Story.create(db, self.project_id, "New Story", "")
+            story = Story.create(self.conn, self.project_id, "New Story", "")
             
             self.add_story_tab(story)
             self.placeholder.hide()
@@ -3,9 +3,32 @@ Timeline canvas for BlueWriter.
 Displays a timeline with sine wave background.
 """
 from PySide6.QtWidgets import QWidget, QMenu
-from PySide6.QtGui import QPainter, QBrush, QColor, QPen, QFont, QMouseEvent, QAction
-from PySide6.QtCore import Qt, QPoint, Signal
+from PySide6.QtGui import (QPainter, QBrush, QColor, QPen, QFont, QMouseEvent, QAction,
+                           QPixmap, QRegion)
+from PySide6.QtCore import Qt, QLineF, QPoint, QPointF, QRect, QRectF, QTimer, Signal
 import math
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+from views.sticky_note import StickyNote
+
+
+def _sine_wave_segments(step: int = 8) -> list:
+    """Return the background sine wave as line segments in canvas coordinates.
+    
+    Args:
+        step: Horizontal distance between sampled points.
+    """
+    # A prominent center sine wave across a wide area
+    amplitude = 80
+    wavelength = 400
+    center_y = 300
+    
+    points = [
+        (x, int(center_y + amplitude * math.sin(2 * math.pi * x / wavelength)))
+        for x in range(-200, 3000, step)
+    ]
+    return [QLineF(x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(points, points[1:])]
 
 
 class TimelineCanvas(QWidget):
@@ -14,20 +37,59 @@ class TimelineCanvas(QWidget):
     # Signal to request new chapter at position
     new_chapter_requested = Signal(float, float)  # canvas x, y position
     
+    # Emitted after pan, zoom or resize changes which part of the canvas is shown
+    viewport_changed = Signal()
+    
+    # Background geometry never changes, so it is built once for all canvases
+    _SINE_SEGMENTS = _sine_wave_segments()
+    _SINE_STARTS = [line.x1() for line in _SINE_SEGMENTS]  # Ascending
+    _SINE_ENDS = [line.x2() for line in _SINE_SEGMENTS]
+    # Low-detail wave drawn while panning when the background isn't cached
+    _SINE_SEGMENTS_COARSE = _sine_wave_segments(step=32)
+    _SINE_COARSE_STARTS = [line.x1() for line in _SINE_SEGMENTS_COARSE]
+    _SINE_COARSE_ENDS = [line.x2() for line in _SINE_SEGMENTS_COARSE]
+    _GUIDE_LINES = [QLineF(-200, y, 3000, y) for y in range(100, 600, 100)]
+    _AXIS_LINE = QLineF(-200, 300, 3000, 300)
+    _TICK_LINES = [QLineF(x, 290, x, 310) for x in range(0, 2800, 200)]
+    _TICK_LABELS = [(x - 20, 330, f"{x // 200}") for x in range(0, 2800, 200)]
+    _TICK_XS = list(range(0, 2800, 200))
+    
+    # Canvas units around a dirty area that can still receive ink from
+    # geometry outside it (pen width, antialiasing, tick label width)
+    _LINE_MARGIN = 4
+    _LABEL_MARGIN = 40
+    
+    # Canvas area covered by the background, including pen width and labels
+    _BACKGROUND_EXTENT = QRectF(-210, 90, 3220, 420)
+    # Above this many logical pixels the background is painted directly
+    # instead; scaled by the pixel ratio squared so HiDPI screens get it too
+    _BACKGROUND_CACHE_MAX_PIXELS = 4_000_000
+    
+    # Pan drags are applied at most once per frame (~60 Hz)
+    PAN_FRAME_MS = 16
+    # Antialiasing and the background cache resume this long after the last
+    # zoom step
+    ZOOM_SETTLE_MS = 100
+    
     def __init__(self, parent=None) -> None:
         """Initialize the timeline canvas."""
         super().__init__(parent)
         self.setMinimumSize(800, 600)
         
-        # Enable context menu
+        # Enable context menu; built once since each one is parented to the canvas
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
+        self._context_menu = QMenu(self)
+        new_chapter_action = QAction("New Chapter Here", self._context_menu)
+        new_chapter_action.triggered.connect(self.request_new_chapter)
+        self._context_menu.addAction(new_chapter_action)
         
-        # Set background color
-        self.setAutoFillBackground(True)
+        # Set background color. paintEvent fills it itself, and only where the
+        # cached background doesn't already cover, so Qt doesn't pre-fill
         palette = self.palette()
         palette.setColor(self.backgroundRole(), QColor(250, 250, 245))
         self.setPalette(palette)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
         
         # Zoom and pan properties
         self.zoom_level = 1.0
@@ -36,6 +98,37 @@ class TimelineCanvas(QWidget):
         self.is_panning = False
         self.last_mouse_pos = QPoint()
         self.last_context_pos = QPoint()
+        
+        # Sticky notes positioned by this canvas, in registration order
+        self._notes = []
+        
+        # Mouse movement since the last applied pan step
+        self._pending_pan = QPoint()
+        self._pan_timer = QTimer(self)
+        self._pan_timer.setSingleShot(True)
+        self._pan_timer.setInterval(self.PAN_FRAME_MS)
+        self._pan_timer.timeout.connect(self._apply_pending_pan)
+        
+        # Running while zooming; redraws antialiased and cached once it settles
+        self._zoom_settle_timer = QTimer(self)
+        self._zoom_settle_timer.setSingleShot(True)
+        self._zoom_settle_timer.setInterval(self.ZOOM_SETTLE_MS)
+        self._zoom_settle_timer.timeout.connect(self.update)
+        
+        # Paint objects reused by every paint
+        self._wave_pen = QPen(QColor(210, 210, 200), 2)
+        self._wave_pen.setStyle(Qt.DashLine)
+        self._coarse_wave_pen = QPen(QColor(210, 210, 200), 2)
+        self._guide_pen = QPen(QColor(220, 220, 215), 2)
+        self._guide_pen.setStyle(Qt.DotLine)
+        self._axis_pen = QPen(QColor(180, 180, 170), 1)
+        self._tick_pen = QPen(QColor(150, 150, 140))
+        self._tick_font = QFont()
+        self._tick_font.setPointSize(8)
+        
+        # Background rendered at one zoom level; pan only moves where it's drawn
+        self._background_cache = None
+        self._background_cache_key = None  # (zoom, device pixel ratio)
     
     # === Coordinate Conversion ===
     
@@ -51,25 +144,65 @@ class TimelineCanvas(QWidget):
         canvas_y = (screen_y - self.pan_y) / self.zoom_level
         return (canvas_x, canvas_y)
     
+    def visible_canvas_rect(self, margin: int = 0) -> QRectF:
+        """Return the visible area in canvas coordinates.
+        
+        Args:
+            margin: Screen pixels to extend the area by on every side.
+        """
+        left, top = self.screen_to_canvas(-margin, -margin)
+        right, bottom = self.screen_to_canvas(self.width() + margin, self.height() + margin)
+        return QRectF(QPointF(left, top), QPointF(right, bottom))
+    
+    def get_transform(self) -> tuple:
+        """Return the canvas-to-screen transform as (scale, offset_x, offset_y)."""
+        return (self.zoom_level, self.pan_x, self.pan_y)
+    
+    def register_note(self, note: StickyNote) -> None:
+        """Start tracking a sticky note and place it for the current view."""
+        self._notes.append(note)
+        scale, offset_x, offset_y = self.get_transform()
+        note.move(int(note.canvas_x * scale + offset_x),
+                  int(note.canvas_y * scale + offset_y))
+    
+    def unregister_note(self, note: StickyNote) -> None:
+        """Stop tracking a sticky note."""
+        try:
+            self._notes.remove(note)
+        except ValueError:
+            pass  # Never registered
+    
     def update_sticky_note_positions(self) -> None:
-        """Reposition all sticky notes based on current pan/zoom."""
-        for child in self.children():
-            if hasattr(child, 'canvas_x') and hasattr(child, 'canvas_y'):
-                screen_x, screen_y = self.canvas_to_screen(child.canvas_x, child.canvas_y)
-                child.move(int(screen_x), int(screen_y))
+        """Reposition all registered sticky notes based on current pan/zoom."""
+        if not self._notes:
+            return
+        scale, offset_x, offset_y = self.get_transform()
+        # Hold repaints so the moves land as one update (re-enabling calls update())
+        self.setUpdatesEnabled(False)
+        try:
+            for note in self._notes:
+                note.move(int(note.canvas_x * scale + offset_x),
+                          int(note.canvas_y * scale + offset_y))
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _viewport_moved(self) -> None:
+        """Reposition notes, announce the new viewport and redraw."""
+        self.update_sticky_note_positions()
+        self.viewport_changed.emit()
+        self.update()
+    
+    def resizeEvent(self, event) -> None:
+        """Announce the viewport change when the canvas is resized."""
+        super().resizeEvent(event)
+        self.viewport_changed.emit()
 
     # === Context Menu ===
     
     def show_context_menu(self, pos: QPoint) -> None:
         """Show context menu on right-click."""
         self.last_context_pos = pos
-        
-        menu = QMenu(self)
-        new_chapter_action = QAction("New Chapter Here", self)
-        new_chapter_action.triggered.connect(self.request_new_chapter)
-        menu.addAction(new_chapter_action)
-        
-        menu.exec(self.mapToGlobal(pos))
+        self._context_menu.exec(self.mapToGlobal(pos))
     
     def request_new_chapter(self) -> None:
         """Emit signal to create new chapter at right-click position (in canvas coords)."""
@@ -84,15 +217,87 @@ class TimelineCanvas(QWidget):
     def paintEvent(self, event) -> None:
         """Handle painting of the canvas."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        background = self.palette().brush(self.backgroundRole())
+        
+        # The background only depends on zoom, so a cached rendering is blitted
+        cached = self._background_pixmap()
+        if cached is not None:
+            position, pixmap = cached
+            size = pixmap.deviceIndependentSize()
+            covered = QRect(QPoint(math.ceil(position.x()), math.ceil(position.y())),
+                            QPoint(math.floor(position.x() + size.width()) - 1,
+                                   math.floor(position.y() + size.height()) - 1))
+            for rect in event.region() - QRegion(covered):
+                painter.fillRect(rect, background)
+            painter.drawPixmap(position, pixmap)
+            return
+        
+        painter.fillRect(event.rect(), background)
+        # Aliased lines are much cheaper to raster while the view is moving
+        interacting = self.is_panning or self._zoom_settle_timer.isActive()
+        painter.setRenderHint(QPainter.Antialiasing, not interacting)
         
         # Apply transformations
         painter.translate(self.pan_x, self.pan_y)
         painter.scale(self.zoom_level, self.zoom_level)
         
-        # Draw background elements
+        # Only geometry near the dirty area needs submitting; the device-pixel
+        # pad covers antialiasing at any zoom
+        inverse, _ = painter.transform().inverted()
+        dirty = inverse.mapRect(QRectF(event.rect()).adjusted(-2, -2, 2, 2))
+        
+        # Draw background elements, in low detail while a pan drag is under way
+        self.draw_sine_wave_background(painter, dirty, coarse=self.is_panning)
+        self.draw_timeline_elements(painter, dirty, coarse=self.is_panning)
+    
+    def _background_pixmap(self) -> Optional[tuple]:
+        """Return the background rendering and where to draw it, or None to paint directly.
+        
+        The pixmap is rendered at the current zoom with the sub-pixel part of
+        the pan baked in, so it is blitted at a whole-pixel position and stays
+        valid while panning by whole pixels. It isn't built during a zoom
+        burst, where every step would need a new rendering costing more than
+        painting the dirty area directly.
+        """
+        if self._zoom_settle_timer.isActive():
+            return None
+        
+        zoom = self.zoom_level
+        ratio = self.devicePixelRatioF()
+        extent = self._BACKGROUND_EXTENT
+        origin_x = (self.pan_x + extent.left() * zoom) * ratio
+        origin_y = (self.pan_y + extent.top() * zoom) * ratio
+        pixel_x = math.floor(origin_x)
+        pixel_y = math.floor(origin_y)
+        position = QPointF(pixel_x / ratio, pixel_y / ratio)
+        
+        key = (zoom, ratio, round(origin_x - pixel_x, 6), round(origin_y - pixel_y, 6))
+        if self._background_cache_key == key:
+            if self._background_cache is None:
+                return None
+            return position, self._background_cache
+        
+        width = math.ceil(extent.width() * zoom * ratio) + 1
+        height = math.ceil(extent.height() * zoom * ratio) + 1
+        self._background_cache_key = key
+        self._background_cache = None
+        if width * height > self._BACKGROUND_CACHE_MAX_PIXELS * ratio * ratio:
+            return None
+        
+        pixmap = QPixmap(width, height)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self.palette().color(self.backgroundRole()))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate((origin_x - pixel_x) / ratio, (origin_y - pixel_y) / ratio)
+        painter.scale(zoom, zoom)
+        painter.translate(-extent.left(), -extent.top())
         self.draw_sine_wave_background(painter)
         self.draw_timeline_elements(painter)
+        painter.end()
+        
+        self._background_cache = pixmap
+        return position, pixmap
     
     # === Mouse Events for Panning ===
     
@@ -112,23 +317,34 @@ class TimelineCanvas(QWidget):
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         """Handle mouse movement for panning."""
         if self.is_panning:
-            delta = event.position().toPoint() - self.last_mouse_pos
-            self.pan_x += delta.x()
-            self.pan_y += delta.y()
-            self.last_mouse_pos = event.position().toPoint()
+            pos = event.position().toPoint()
+            self._pending_pan += pos - self.last_mouse_pos
+            self.last_mouse_pos = pos
             
-            # Reposition all sticky notes
-            self.update_sticky_note_positions()
-            self.update()
+            # Apply the accumulated movement on the next frame
+            if not self._pan_timer.isActive():
+                self._pan_timer.start()
             event.accept()
             return
         super().mouseMoveEvent(event)
     
+    def _apply_pending_pan(self) -> None:
+        """Pan by the accumulated mouse movement and reposition the notes."""
+        self._pan_timer.stop()
+        if self._pending_pan.isNull():
+            return
+        self.pan_x += self._pending_pan.x()
+        self.pan_y += self._pending_pan.y()
+        self._pending_pan = QPoint()
+        self._viewport_moved()
+    
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """Handle mouse release to stop panning."""
         if event.button() in (Qt.LeftButton, Qt.MiddleButton) and self.is_panning:
             self.is_panning = False
             self.setCursor(Qt.ArrowCursor)
+            self._apply_pending_pan()
+            self.update()  # Redraw in full detail
             event.accept()
             return
         super().mouseReleaseEvent(event)
@@ -157,78 +373,91 @@ class TimelineCanvas(QWidget):
         self.pan_y += mouse_pos.y() - new_screen_y
         
         # Reposition sticky notes and redraw
-        self.update_sticky_note_positions()
-        self.update()
+        self._zoom_settle_timer.start()
+        self._viewport_moved()
         event.accept()
     
     def zoom_in(self) -> None:
         """Zoom in on the canvas."""
         self.zoom_level *= 1.2
         self.zoom_level = min(self.zoom_level, 5.0)
-        self.update_sticky_note_positions()
-        self.update()
+        self._zoom_settle_timer.start()
+        self._viewport_moved()
     
     def zoom_out(self) -> None:
         """Zoom out on the canvas."""
         self.zoom_level /= 1.2
         self.zoom_level = max(self.zoom_level, 0.2)
-        self.update_sticky_note_positions()
-        self.update()
+        self._zoom_settle_timer.start()
+        self._viewport_moved()
     
     def reset_zoom(self) -> None:
         """Reset zoom to 100% and center."""
         self.zoom_level = 1.0
         self.pan_x = 0
         self.pan_y = 0
-        self.update_sticky_note_positions()
-        self.update()
+        self._viewport_moved()
 
     # === Drawing Functions ===
     
-    def draw_sine_wave_background(self, painter: QPainter) -> None:
-        """Draw a sine wave pattern as background guide."""
-        pen = QPen(QColor(210, 210, 200), 2)
-        pen.setStyle(Qt.DashLine)
-        painter.setPen(pen)
+    def draw_sine_wave_background(self, painter: QPainter,
+                                  area: Optional[QRectF] = None,
+                                  coarse: bool = False) -> None:
+        """Draw a sine wave pattern as background guide.
+        
+        Args:
+            painter: Painter already transformed to canvas coordinates.
+            area: Canvas area to draw; everything is drawn if omitted.
+            coarse: Draw the wave with fewer, solid segments.
+        """
+        if coarse:
+            sine, starts, ends = (self._SINE_SEGMENTS_COARSE,
+                                  self._SINE_COARSE_STARTS, self._SINE_COARSE_ENDS)
+        else:
+            sine, starts, ends = self._SINE_SEGMENTS, self._SINE_STARTS, self._SINE_ENDS
+        guides = self._GUIDE_LINES
+        if area is not None:
+            margin = self._LINE_MARGIN
+            first = bisect_left(ends, area.left() - margin)
+            last = bisect_right(starts, area.right() + margin)
+            sine = sine[first:last]
+            guides = [line for line in guides
+                      if area.top() - margin <= line.y1() <= area.bottom() + margin]
         
         # Draw a prominent center sine wave
-        amplitude = 80
-        wavelength = 400
-        center_y = 300
-        
-        # Draw the wave across a wide area
-        points = []
-        for x in range(-200, 3000, 8):
-            y = center_y + amplitude * math.sin(2 * math.pi * x / wavelength)
-            points.append((x, y))
-        
-        for i in range(len(points) - 1):
-            painter.drawLine(
-                int(points[i][0]), int(points[i][1]),
-                int(points[i+1][0]), int(points[i+1][1])
-            )
+        painter.setPen(self._coarse_wave_pen if coarse else self._wave_pen)
+        painter.drawLines(sine)
         
         # Draw some horizontal guide lines
-        pen.setStyle(Qt.DotLine)
-        pen.setColor(QColor(220, 220, 215))
-        painter.setPen(pen)
-        
-        for y in range(100, 600, 100):
-            painter.drawLine(-200, y, 3000, y)
+        painter.setPen(self._guide_pen)
+        painter.drawLines(guides)
     
-    def draw_timeline_elements(self, painter: QPainter) -> None:
-        """Draw timeline markers and labels."""
+    def draw_timeline_elements(self, painter: QPainter,
+                               area: Optional[QRectF] = None,
+                               coarse: bool = False) -> None:
+        """Draw timeline markers and labels.
+        
+        Args:
+            painter: Painter already transformed to canvas coordinates.
+            area: Canvas area to draw; everything is drawn if omitted.
+            coarse: Skip the tick labels.
+        """
+        ticks = self._TICK_LINES
+        labels = () if coarse else self._TICK_LABELS
+        if area is not None:
+            first = bisect_left(self._TICK_XS, area.left() - self._LABEL_MARGIN)
+            last = bisect_right(self._TICK_XS, area.right() + self._LABEL_MARGIN)
+            ticks = ticks[first:last]
+            labels = labels[first:last]
+        
         # Draw main horizontal axis
-        pen = QPen(QColor(180, 180, 170), 1)
-        painter.setPen(pen)
-        painter.drawLine(-200, 300, 3000, 300)
+        painter.setPen(self._axis_pen)
+        painter.drawLine(self._AXIS_LINE)
         
         # Draw vertical markers
-        font = QFont()
-        font.setPointSize(8)
-        painter.setFont(font)
-        painter.setPen(QPen(QColor(150, 150, 140)))
-        
-        for x in range(0, 2800, 200):
-            painter.drawLine(x, 290, x, 310)
-            painter.drawText(x - 20, 330, f"{x // 200}")
+        painter.setFont(self._tick_font)
+        painter.setPen(self._tick_pen)
+        
+        painter.drawLines(ticks)
+        for x, y, label in labels:
+            painter.drawText(x, y, label)